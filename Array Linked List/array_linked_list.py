@@ -0,0 +1,314 @@
+import inspect
+from array import array
+
+NIL = -1  # "None" for index pointers
+
+
+class ArrayLinkedList:
+    def __init__(self, initial_values=None, typecode=None):
+        # Values and next pointers live in two parallel contiguous buffers.
+        # typecode (e.g. 'q', 'd') stores numeric values unboxed in an array,
+        # otherwise a python list of references is used.
+        self.values = array(typecode) if typecode else []
+        self.next = array('q')
+
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.free = NIL  # free-slot chain, threaded through self.next
+
+        if initial_values:
+            self.extend(initial_values)
+
+    def _alloc(self, value):
+        # Time Complexity ==> O(1) amortized
+
+        # Reuse a released slot before growing the buffers
+        # Store first: a typed array rejecting the value must not lose the slot
+        slot = self.free
+        if slot != NIL:
+            self.values[slot] = value
+            self.free = self.next[slot]
+            self.next[slot] = NIL
+        else:
+            slot = len(self.next)
+            self.values.append(value)
+            self.next.append(NIL)
+
+        self.length += 1
+        return slot
+
+    def _release(self, slot):
+        if isinstance(self.values, list):
+            self.values[slot] = None  # don't keep the payload alive
+
+        self.next[slot] = self.free
+        self.free = slot
+        self.length -= 1
+
+    def capacity(self):
+        return len(self.next)
+
+    def extend(self, values):
+        # Time Complexity ==> O(k)
+        for value in values:
+            self.insert_end(value)
+
+    def insert_end(self, value):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        slot = self._alloc(value)
+
+        if self.tail == NIL:
+            self.head = self.tail = slot
+        else:
+            self.next[self.tail] = slot
+            self.tail = slot
+
+    def insert_front(self, value):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        slot = self._alloc(value)
+
+        if self.head == NIL:
+            self.head = self.tail = slot
+        else:
+            self.next[slot] = self.head
+            self.head = slot
+
+    def delete_front(self):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        if self.head == NIL:
+            return "Linked List is Empty"
+
+        slot = self.head
+        self.head = self.next[slot]
+        if self.head == NIL:
+            self.tail = NIL
+
+        self._release(slot)
+
+    def delete_last(self):
+        # Time Complexity ==> O(n), a singly linked list must find the predecessor
+        # Space Complexity ==> O(1)
+
+        if self.head == NIL:
+            return "Linked List is Empty"
+
+        if self.head == self.tail:
+            slot = self.head
+            self.head = self.tail = NIL
+        else:
+            prev = self.head
+            while self.next[prev] != self.tail:
+                prev = self.next[prev]
+
+            slot = self.tail
+            self.next[prev] = NIL
+            self.tail = prev
+
+        self._release(slot)
+
+    def delete_node_nth(self, node):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        if node < 0 or node >= self.length:
+            return "Invalid Node"
+
+        elif node == 0:
+            self.delete_front()
+            return "First Item Deleted"
+
+        elif node == self.length - 1:
+            self.delete_last()
+            return "Last Item Deleted"
+
+        prev = self.head
+        for _ in range(node - 1):
+            prev = self.next[prev]
+
+        slot = self.next[prev]
+        value = self.values[slot]
+        self.next[prev] = self.next[slot]
+        self._release(slot)
+
+        return f"Node {node} with value {value} Deleted"
+
+    def get_nth_back(self, n):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        if n > self.length or n <= 0:
+            return None
+
+        slot = self.head
+        for _ in range(self.length - n):
+            slot = self.next[slot]
+
+        return self.values[slot]
+
+    def is_identical_to(self, lst):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        if self.length != lst.length:
+            return False
+
+        return all(a == b for a, b in zip(self, lst))
+
+    def __iter__(self):
+        values, next_slot = self.values, self.next
+        slot = self.head
+
+        while slot != NIL:
+            yield values[slot]
+            slot = next_slot[slot]
+
+    def __repr__(self):
+        return ', '.join(map(str, self))
+
+    def debug_verify_data_integrity(self):
+        if self.length == 0:
+            assert self.head == NIL
+            assert self.tail == NIL
+        else:
+            assert self.head != NIL
+            assert self.tail != NIL
+            assert self.next[self.tail] == NIL
+
+        actual_lst_len = 0
+        slot = self.head
+        while slot != NIL:
+            slot = self.next[slot]
+            actual_lst_len += 1
+            assert actual_lst_len <= self.length  # Consider infinite cycle
+
+        free_slots = 0
+        slot = self.free
+        while slot != NIL:
+            slot = self.next[slot]
+            free_slots += 1
+            assert free_slots <= self.capacity()
+
+        assert self.length == actual_lst_len
+        assert self.length + free_slots == self.capacity()
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ArrayLinkedList([10, 20, 30])
+
+    lst.insert_front(5)
+    lst.insert_end(40)
+    lst.debug_verify_data_integrity()
+    result = str(lst)
+    expected = "5, 10, 20, 30, 40"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ArrayLinkedList([])
+
+    result = f'{lst.delete_front()} | {lst.delete_last()} | {lst.get_nth_back(1)}'
+    expected = "Linked List is Empty | Linked List is Empty | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ArrayLinkedList([10, 20, 30, 40, 50])
+
+    lst.delete_front()
+    lst.delete_last()
+    message = lst.delete_node_nth(1)
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {message}'
+    expected = "20, 40 | Node 1 with value 30 Deleted"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ArrayLinkedList([6, 10, 8, 15], typecode='q')
+
+    result = f'{lst.get_nth_back(2)} | {lst.get_nth_back(4)} | {lst.get_nth_back(5)}'
+    expected = "8 | 6 | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test5():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst1 = ArrayLinkedList([1, 2, 3])
+    lst2 = ArrayLinkedList([1, 2, 3], typecode='q')
+    lst3 = ArrayLinkedList([1, 2, 4])
+
+    result = f'{lst1.is_identical_to(lst2)} | {lst1.is_identical_to(lst3)}'
+    expected = "True | False"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test6():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ArrayLinkedList(range(4))
+
+    # queue churn must reuse freed slots instead of growing the buffers
+    for value in range(4, 1000):
+        lst.delete_front()
+        lst.insert_end(value)
+
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {lst.capacity()}'
+    expected = "996, 997, 998, 999 | 4"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test7():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ArrayLinkedList([1, 2, 3], typecode='q')
+
+    lst.delete_front()
+    errors = 0
+    for value in (1.5, 2.5):  # rejected by the typed array, free slot and tail buffer alike
+        try:
+            lst.insert_end(value)
+        except TypeError:
+            errors += 1
+    lst.insert_end(4)
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {errors} | {lst.capacity()}'
+    expected = "2, 3, 4 | 2 | 3"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # insert front / end
+    test2()  # empty list
+    test3()  # delete front / last / nth
+    test4()  # get nth back, typed storage
+    test5()  # identical lists
+    test6()  # free-slot reuse
+    test7()  # rejected value keeps the free slot
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
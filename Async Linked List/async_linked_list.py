@@ -0,0 +1,163 @@
+import asyncio
+import inspect
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from linked_list_loader import load_linked_list  # noqa: E402
+
+
+LinkedList = load_linked_list()
+
+
+class Closed(Exception):
+    pass
+
+
+class AsyncLinkedList:
+    # asyncio front end for LinkedList: put() appends with insert_end, get()
+    # pops with delete_front. Producers are suspended (not polling) while
+    # length >= high_water, consumers while the list is empty.
+
+    def __init__(self, high_water=None, lst=None):
+        self.lst = lst if lst is not None else LinkedList()
+        self.high_water = high_water
+        self.closed = False
+
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    @property
+    def length(self):
+        return self.lst.length
+
+    def __repr__(self):
+        return repr(self.lst)
+
+    def _full(self):
+        return self.high_water is not None and self.lst.length >= self.high_water
+
+    async def put(self, value):
+        async with self._not_full:
+            await self._not_full.wait_for(lambda: self.closed or not self._full())
+            if self.closed:
+                raise Closed('put() on a closed AsyncLinkedList')
+
+            self.lst.insert_end(value)
+            self._not_empty.notify()
+
+    async def get(self):
+        # Raises Closed once the list is closed and drained
+        async with self._not_empty:
+            await self._not_empty.wait_for(lambda: self.lst.length > 0 or self.closed)
+            if self.lst.length == 0:
+                raise Closed('get() on a closed, empty AsyncLinkedList')
+
+            value = self.lst.head.data
+            self.lst.delete_front()
+            self._not_full.notify()
+            return value
+
+    async def close(self):
+        # Pending values can still be consumed, blocked producers get Closed
+        async with self._not_empty:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except Closed:
+            raise StopAsyncIteration
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    async def scenario():
+        lst = AsyncLinkedList()
+        for value in (10, 20, 30):
+            await lst.put(value)
+        first = await lst.get()
+        return f'{first} | {lst} | {lst.length}'
+
+    result = asyncio.run(scenario())
+    expected = "10 | 20, 30 | 2"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    async def scenario():
+        lst = AsyncLinkedList(high_water=2)
+        max_length = 0
+
+        async def produce():
+            for value in range(10):
+                await lst.put(value)
+            await lst.close()
+
+        async def consume():
+            nonlocal max_length
+            values = []
+            async for value in lst:
+                max_length = max(max_length, lst.length + 1)
+                values.append(value)
+                await asyncio.sleep(0)
+            return values
+
+        _, values = await asyncio.gather(produce(), consume())
+        return f'{values} | {max_length}'
+
+    result = asyncio.run(scenario())
+    expected = "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9] | 2"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    async def scenario():
+        lst = AsyncLinkedList(high_water=1)
+        await lst.put(1)
+
+        # second put is suspended at the high-water mark
+        blocked = asyncio.ensure_future(lst.put(2))
+        await asyncio.sleep(0)
+        suspended = not blocked.done()
+
+        await lst.close()
+        try:
+            await blocked
+            outcome = 'Put'
+        except Closed:
+            outcome = 'Closed'
+
+        drained = [value async for value in lst]
+        return f'{suspended} | {outcome} | {drained}'
+
+    result = asyncio.run(scenario())
+    expected = "True | Closed | [1]"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # put / get
+    test2()  # producer suspended at high-water mark, async for
+    test3()  # close wakes blocked producers
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
@@ -0,0 +1,133 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from linked_list_loader import load_linked_list  # noqa: E402
+
+DEFAULT_SIZES = (10**3, 10**4, 10**5)  # pass --sizes up to 10**7 for the full run
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+HomeworkLinkedList = load_linked_list('homework')
+DeleteLinkedList = load_linked_list('delete')
+
+
+# Each case: (LinkedList class, extra nodes consumed by the ops, operation)
+# The list is built with size + extra values, so deletes keep it near `size`.
+CASES = {
+    'insert_end': (HomeworkLinkedList, 0, lambda lst, i: lst.insert_end(i)),
+    'insert_front': (HomeworkLinkedList, 0, lambda lst, i: lst.insert_front(i)),
+    'delete_front': (HomeworkLinkedList, 1, lambda lst, i: lst.delete_front()),
+    'delete_last': (DeleteLinkedList, 1, lambda lst, i: lst.delete_last()),
+    'delete_node_nth': (DeleteLinkedList, 1, lambda lst, i: lst.delete_node_nth(lst.length // 2)),
+    'get_nth_back': (HomeworkLinkedList, 0, lambda lst, i: lst.get_nth_back(lst.length // 2)),
+    'is_identical_to': (HomeworkLinkedList, 0, lambda lst, i: lst.is_identical_to(lst)),
+    'add_element': (HomeworkLinkedList, 0, lambda lst, i: lst.add_element(i)),
+    'get_tail': (HomeworkLinkedList, 0, lambda lst, i: lst.get_tail()),
+    '__repr__': (HomeworkLinkedList, 0, lambda lst, i: repr(lst)),
+}
+
+
+def time_case(name, size, ops, repeat):
+    # Returns seconds per operation on a list of about `size` nodes: the best
+    # of `repeat` runs on a fresh list, so one noisy run doesn't count as a regression
+    cls, extra, operation = CASES[name]
+    best = float('inf')
+
+    for _ in range(repeat):
+        lst = cls(range(size + extra * ops))
+
+        start = time.perf_counter()
+        for i in range(ops):
+            operation(lst, i)
+        best = min(best, time.perf_counter() - start)
+
+    return best / ops
+
+
+def run(sizes, ops, names, repeat):
+    results = {}
+
+    for name in names:
+        results[name] = {}
+        for size in sizes:
+            results[name][str(size)] = time_case(name, size, ops, repeat)
+            print(f'{name:<16} n={size:<10} {results[name][str(size)] * 1e6:12.2f} us/op', flush=True)
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'ops_per_measurement': ops,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    # Returns the list of (op, size, ratio) slower than baseline * (1 + tolerance)
+    regressions = []
+
+    for name, by_size in report['results'].items():
+        for size, seconds in by_size.items():
+            expected = baseline['results'].get(name, {}).get(size)
+            if not expected:
+                continue
+
+            ratio = seconds / expected
+            if ratio > 1 + tolerance:
+                regressions.append((name, size, ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time every LinkedList operation at several sizes.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--ops', type=int, default=100, help='operations timed per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per case, the fastest is kept')
+    parser.add_argument('--only', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slowdown before failing, 0.5 means 50%% slower')
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--allow-missing-baseline', action='store_true',
+                        help='skip the comparison (exit 0) when the baseline file is missing')
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.ops, args.only, args.repeat)
+
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f'Results written to {args.output}')
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f'Baseline updated: {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        # A missing baseline fails by default, otherwise a regression could never fail the run
+        print(f'No baseline at {args.baseline}, run with --update-baseline to store one')
+        return 0 if args.allow_missing_baseline else 1
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(report, baseline, args.tolerance)
+    for name, size, ratio in regressions:
+        print(f'REGRESSION {name} n={size}: {ratio:.2f}x slower than baseline')
+
+    if regressions:
+        return 1
+
+    print('No regressions against baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
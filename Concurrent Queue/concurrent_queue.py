@@ -0,0 +1,251 @@
+import inspect
+import queue
+import threading
+import time
+
+
+class Node:
+    __slots__ = ('data', 'next')  # no per-instance __dict__
+
+    def __init__(self, data, next=None):
+        self.data = data
+        self.next = next
+
+    def __repr__(self):
+        return f'{self.data}'
+
+
+class ConcurrentQueue:
+    # Two-lock queue (Michael & Scott): producers only take the tail lock,
+    # consumers only take the head lock. A dummy node keeps head and tail
+    # apart, so an insert_end never waits for a delete_front and vice versa.
+
+    def __init__(self, initial_values=None):
+        dummy = Node(None)
+        self.head = dummy  # always the dummy, first value is head.next
+        self.tail = dummy
+
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        self._waiting = 0  # consumers blocked in delete_front
+
+        # Each counter is only written under its own lock
+        self._inserted = 0
+        self._removed = 0
+
+        if initial_values:
+            for value in initial_values:
+                self.insert_end(value)
+
+    @property
+    def length(self):
+        # Snapshot, may already be stale under contention
+        return self._inserted - self._removed
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return ', '.join(str(node.data) for node in self._iter_nodes())
+
+    def _iter_nodes(self):
+        temp_head = self.head.next
+        while temp_head is not None:
+            yield temp_head
+            temp_head = temp_head.next
+
+    def insert_end(self, value):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        node = Node(value)
+
+        with self._tail_lock:
+            self.tail.next = node
+            self.tail = node
+            self._inserted += 1
+
+        # Consumers register in _waiting before checking for a node,
+        # so either they see this node or we see them waiting
+        if self._waiting:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def delete_front(self, block=True, timeout=None):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        # Returns the front value, raises queue.Empty when nothing arrives
+        with self._head_lock:
+            if self.head.next is None:
+                if not block:
+                    raise queue.Empty
+
+                self._waiting += 1
+                try:
+                    if not self._not_empty.wait_for(lambda: self.head.next is not None, timeout):
+                        raise queue.Empty
+                finally:
+                    self._waiting -= 1
+
+            node = self.head.next
+            value = node.data
+            node.data = None  # the first node becomes the new dummy
+            self.head = node
+            self._removed += 1
+
+        return value
+
+    put = insert_end
+    get = delete_front
+
+    def get_nowait(self):
+        return self.delete_front(block=False)
+
+    def debug_verify_data_integrity(self):
+        # Only meaningful while no thread is mutating the queue
+        with self._head_lock, self._tail_lock:
+            assert self.head is not None
+            assert self.tail is not None
+            assert self.tail.next is None
+
+            actual_lst_len = 0
+            last = self.head
+            for node in self._iter_nodes():
+                last = node
+                actual_lst_len += 1
+                assert actual_lst_len <= self.length  # Consider infinite cycle
+
+            assert last is self.tail
+            assert self.length == actual_lst_len
+
+
+def _run_producers_consumers(make_queue, put, get, threads, items):
+    # Half producers, half consumers (at least one of each)
+    producers = max(1, threads // 2)
+    consumers = max(1, threads - producers)
+    per_producer = items // producers
+    total = per_producer * producers
+    per_consumer = [total // consumers + (1 if i < total % consumers else 0) for i in range(consumers)]
+    work = make_queue()
+
+    def produce():
+        for value in range(per_producer):
+            put(work, value)
+
+    def consume(count):
+        for _ in range(count):
+            get(work)
+
+    workers = [threading.Thread(target=produce) for _ in range(producers)]
+    workers += [threading.Thread(target=consume, args=(count,)) for count in per_consumer]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return total / (time.perf_counter() - start)
+
+
+def benchmark_throughput(thread_counts=(1, 2, 4, 8, 16, 32), items=200_000):
+    # Items per second through the queue, compared against queue.Queue
+    for threads in thread_counts:
+        two_lock = _run_producers_consumers(ConcurrentQueue, ConcurrentQueue.insert_end,
+                                            ConcurrentQueue.delete_front, threads, items)
+        stdlib = _run_producers_consumers(queue.Queue, queue.Queue.put, queue.Queue.get, threads, items)
+        print(f'threads={threads:<3} two-lock={two_lock:12,.0f} items/s   queue.Queue={stdlib:12,.0f} items/s')
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ConcurrentQueue([10, 20])
+
+    lst.insert_end(30)
+    first = lst.delete_front()
+    lst.debug_verify_data_integrity()
+    result = f'{first} | {lst} | {lst.length}'
+    expected = "10 | 20, 30 | 2"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ConcurrentQueue([])
+
+    results = []
+    for pop in (lst.get_nowait, lambda: lst.delete_front(timeout=0.01)):
+        try:
+            results.append(pop())
+        except queue.Empty:
+            results.append('Empty')
+
+    lst.debug_verify_data_integrity()
+    result = f'{results} | [{lst}]'
+    expected = "['Empty', 'Empty'] | []"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ConcurrentQueue([])
+    received = []
+
+    # consumer blocks until the producer thread inserts
+    consumer = threading.Thread(target=lambda: received.append(lst.get(timeout=5)))
+    consumer.start()
+    time.sleep(0.01)
+    lst.put(42)
+    consumer.join()
+
+    result = f'{received} | {lst.length}'
+    expected = "[42] | 0"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = ConcurrentQueue([])
+    totals = []
+
+    def produce(start):
+        for value in range(start, start + 5000):
+            lst.insert_end(value)
+
+    def consume():
+        totals.append(sum(lst.delete_front(timeout=5) for _ in range(5000)))
+
+    workers = [threading.Thread(target=produce, args=(i * 5000,)) for i in range(4)]
+    workers += [threading.Thread(target=consume) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    lst.debug_verify_data_integrity()
+    result = f'{sum(totals) == sum(range(20000))} | {lst.length}'
+    expected = "True | 0"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # FIFO order
+    test2()  # non-blocking / timed out pops
+    test3()  # blocking pop woken by a producer
+    test4()  # 4 producers, 4 consumers
+
+    # benchmark_throughput()
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
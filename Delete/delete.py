@@ -1,7 +1,95 @@
+import array
+import functools
 import inspect
+import io
+import itertools
+import mmap
+import pickle
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+import weakref
+
+try:
+    import numpy
+except ImportError:  # optional, only to_numpy() / from_numpy() need it
+    numpy = None
+
+
+def instrumented(method):
+    # Marks an operation to be recorded on lists built with instrument=True.
+    # The class keeps the plain method, so other lists pay nothing per call.
+    method._instrumented = True
+    return method
+
+
+def _recording(method):
+    # Records calls, pointer hops and a latency histogram per operation
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        hops = self._hops
+        start = time.perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            op = self._stats.get(name)
+            if op is None:
+                op = self._stats[name] = {'calls': 0, 'hops': 0, 'total_ns': 0, 'histogram': {}}
+
+            op['calls'] += 1
+            op['hops'] += self._hops - hops  # includes nested operations
+            op['total_ns'] += elapsed
+            bucket = 1 << elapsed.bit_length()  # power of two upper bound in ns
+            op['histogram'][bucket] = op['histogram'].get(bucket, 0) + 1
+
+    return wrapper
+
+
+_instrumented_classes = {}  # plain class -> generated recording subclass
+
+
+def _instrumented_class(cls):
+    # Subclass of cls overriding every @instrumented method with a recording
+    # wrapper. Built once per class; instrument=True moves the instance into it
+    # (a subclass, not instance attributes, so __repr__ is covered too).
+    if '_plain_class' in cls.__dict__:
+        return cls
+
+    recording = _instrumented_classes.get(cls)
+    if recording is None:
+        methods = {'_plain_class': cls, '__module__': cls.__module__, '__qualname__': cls.__qualname__}
+        for name in dir(cls):
+            member = getattr(cls, name)
+            if getattr(member, '_instrumented', False):
+                methods[name] = _recording(member)
+
+        recording = _instrumented_classes[cls] = type(cls.__name__, (cls,), methods)
+
+    return recording
+
+# dump()/load() header: magic, version, typecode, byte order, length
+DUMP_HEADER = struct.Struct('<4sBccxQ')
+DUMP_MAGIC = b'LLST'
+DUMP_VERSION = 1
+DUMP_CHUNK = 1 << 16  # values packed per write
+
+STREAM_CHUNK = 1 << 20  # characters read / buffered per block by from_file() and to_file()
+
+# Integrity checks after each mutation:
+#   'off'   nothing
+#   'cheap' O(1) invariants, plus a full walk every verify_every mutations
+#   'full'  a full walk every time (the old behaviour)
+VERIFY_LEVELS = ('off', 'cheap', 'full')
 
 
 class Node:
+    __slots__ = ('data', 'next', '__weakref__')  # no per-instance __dict__, weakly referenceable
+
     def __init__(self, data, next=None):
         self.data = data
         self.next = next
@@ -11,38 +99,219 @@ class Node:
 
 
 class LinkedList:
-    def __init__(self, initial_values=None):
+    repr_limit = None  # max values shown by repr(), None shows all
+
+    def __init__(self, initial_values=None, track_nodes=True, instrument=False, pool_size=0,
+                 track_index=False, index_key=None, verify='cheap', verify_every=1024):
         self.head = None
         self.tail = None
         self.length = 0
 
-        self.debug_data = []  # add/remove nodes you use
+        # id(node) -> node, dicts keep insertion order and add/remove in O(1).
+        # Weak values: the registry never keeps a node alive, an entry vanishes
+        # with its node. It is not free: ~160 B per node on top of the 56 B node
+        # and ~3.5x the build time, see memory_footprint()['registry_bytes_per_node']
+        # and benchmark_tracking(). track_nodes=False skips the bookkeeping entirely
+        self.debug_data = weakref.WeakValueDictionary() if track_nodes else None
+
+        # Per-operation counters, see instrumented(). None when disabled.
+        self._stats = {} if instrument else None
+        self._hops = 0
+        if instrument:
+            self.__class__ = _instrumented_class(type(self))
+
+        # Recycled nodes from deletes, reused by inserts (at most pool_size)
+        self.pool_size = pool_size
+        self._pool = []
+        self.pool_hits = 0
+        self.pool_misses = 0
+
+        # key(value) -> {id(node): node} and id(node) -> previous node, so
+        # membership, find and delete_value never walk. Each bucket holds its
+        # nodes in list order (inserts only append, sort rebuilds). None when disabled.
+        self.index_key = index_key
+        self._index = {} if track_index else None
+        self._prev = {} if track_index else None
+
+        # See VERIFY_LEVELS, verify_every=None leaves full walks to on-demand calls
+        assert verify in VERIFY_LEVELS, f'verify must be one of {VERIFY_LEVELS}'
+        self.verify = verify
+        self.verify_every = verify_every
+        self._mutations = 0
+        self.cheap_checks = 0
+        self.full_checks = 0
 
         if initial_values:
-            for value in initial_values:
-                self.insert_end(value)
+            self.extend(initial_values)
+
+    @classmethod
+    def from_iterable(cls, values, **kwargs):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1) besides the nodes
+
+        # kwargs are the constructor's settings. Nodes are linked as the
+        # iterator / generator produces values, nothing is collected up front
+        lst = cls(**kwargs)
+        lst.extend(values)
+        return lst
+
+    from_iter = from_iterable  # streaming name, e.g. LinkedList.from_iter(generator)
+
+    @instrumented
+    def extend(self, values):
+        # Time Complexity ==> O(k)
+        # Space Complexity ==> O(1)
+
+        # Link all values in one pass, then verify once instead of per node
+        tail = self.tail
+
+        # values may raise midway: self.tail must still end on the last linked node
+        try:
+            for value in values:
+                if self._index is not None:
+                    bucket = self._index_bucket(value)
+                node = self._new_node(value)
+                self._add_node(node)
+                if self._index is not None:
+                    self._index_add(bucket, node, tail)
+
+                if tail is None:
+                    self.head = node
+                else:
+                    tail.next = node
+                tail = node
+        finally:
+            self.tail = tail
+
+        self._verify_mutation()
 
     
+    @instrumented
     def __repr__(self):
-        represent = ''
-        temp_head = self.head
+        # Time Complexity ==> O(n), O(repr_limit) when truncated
+        # Space Complexity ==> O(n)
 
-        while temp_head is not None:
-            represent += str(temp_head.data)
-            temp_head = temp_head.next
-            if temp_head:
-                represent += ', '
+        limit = self.repr_limit
+        assert limit is None or limit >= 0, f'repr_limit must be None or >= 0, got {limit}'
+        values = (str(node.data) for node in self._iter_nodes())
+
+        if limit is None or self.length <= limit + 1:
+            self._count_hops(self.length)
+            return ', '.join(values)
+
+        self._count_hops(limit)
+
+        # first `limit` values ... tail, repr_limit=0 shows only the tail
+        represent = ''.join(f'{value}, ' for value in itertools.islice(values, limit))
+        return f'{represent}... {self.length - limit - 1} more ..., {self.tail.data}'
+
+    @instrumented
+    def write_to(self, fileobj, chunk_size=1024, separator=', '):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(chunk_size)
+
+        # Streams the full (never truncated) repr, chunk_size values per write
+        chunk = []
+        lead = ''
+        written = 0
+
+        for node in self._iter_nodes():
+            chunk.append(str(node.data))
+
+            if len(chunk) == chunk_size:
+                fileobj.write(lead + separator.join(chunk))
+                lead = separator
+                written += len(chunk)
+                chunk.clear()
+
+        if chunk:
+            fileobj.write(lead + separator.join(chunk))
+            written += len(chunk)
+
+        self._count_hops(written)
+        return written
+
+    @instrumented
+    def to_numpy(self, dtype=None):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(n)
+
+        # dtype=None lets numpy infer it (ints stay int64) from a temporary list
+        # of the values; with a dtype, one walk fills one preallocated array
+        if numpy is None:
+            raise ImportError('to_numpy() requires numpy')
+
+        self._count_hops(self.length)
+        values = (node.data for node in self._iter_nodes())
+        if dtype is None:
+            return numpy.array(list(values))
+
+        return numpy.fromiter(values, dtype=dtype, count=self.length)
 
-        return represent
+    @classmethod
+    def from_numpy(cls, values, **kwargs):
+        # tolist() unboxes in C, then extend() links everything in one pass
+        return cls(values.tolist(), **kwargs)
     
+    def _count_hops(self, hops):
+        if self._stats is not None:
+            self._hops += hops
+
+    def stats(self):
+        # Snapshot: {operation: {calls, hops, total_ns, histogram: {ns upper bound: calls}}}
+        if self._stats is None:
+            return {}
+
+        return {
+            name: {**op, 'histogram': dict(sorted(op['histogram'].items()))}
+            for name, op in self._stats.items()
+        }
+
+    def reset_stats(self):
+        if self._stats is not None:
+            self._stats = {}
+            self._hops = 0
+
+    def _new_node(self, value):
+        if self._pool:
+            self.pool_hits += 1
+            node = self._pool.pop()
+            node.data = value
+            return node
+
+        if self.pool_size:
+            self.pool_misses += 1
+        return Node(value)
+
+    def _release_node(self, node):
+        # Pooled nodes drop their payload and link so nothing leaks through them
+        if len(self._pool) < self.pool_size:
+            node.data = None
+            node.next = None
+            self._pool.append(node)
+
+    def pool_stats(self):
+        return {
+            'pooled': len(self._pool),
+            'pool_size': self.pool_size,
+            'hits': self.pool_hits,
+            'misses': self.pool_misses,
+        }
+
     def _add_node(self, node):
-        self.debug_data.append(node)
+        if self.debug_data is not None:
+            self.debug_data[id(node)] = node
         self.length += 1
         
+    @instrumented
     def insert_end(self, value):
         
-        node = Node(value)
+        if self._index is not None:
+            bucket = self._index_bucket(value)
+        node = self._new_node(value)
         self._add_node(node)
+        if self._index is not None:
+            self._index_add(bucket, node, self.tail)
 
         if not self.head:
             self.head = self.tail = node
@@ -50,18 +319,348 @@ class LinkedList:
             self.tail.next = node
             self.tail = node
 
-        self.debug_verify_data_integrity()  # ** verify as possible
+        self._verify_mutation()  # ** verify as possible
     
     def _delete_node(self, node):
-        if node in self.debug_data:
-            self.debug_data.remove(node)
-        else:
+        if self.debug_data is not None and self.debug_data.pop(id(node), None) is None:
             print("Node does't exist!!")
             return
 
+        if self._index is not None:
+            self._index_remove(node)
         self.length -= 1
+
+    def _index_key(self, value):
+        return value if self.index_key is None else self.index_key(value)
+
+    def _index_bucket(self, value):
+        # Before the list changes: an unhashable key or a failing index_key raises here
+        return self._index.setdefault(self._index_key(value), {})
+
+    def _index_add(self, bucket, node, prev):
+        bucket[id(node)] = node
+        self._prev[id(node)] = prev
+
+    def _index_remove(self, node):
+        # node.next must still point to its successor here
+        key = self._index_key(node.data)
+        bucket = self._index[key]
+        del bucket[id(node)]
+        if not bucket:
+            del self._index[key]
+
+        prev = self._prev.pop(id(node))
+        if node.next is not None:
+            self._prev[id(node.next)] = prev
+
+    def _rebuild_index(self):
+        # Time Complexity ==> O(n), after relinking many nodes at once
+        self._index = {}
+        self._prev = {}
+        prev = None
+        for node in self._iter_nodes():
+            self._index_add(self._index_bucket(node.data), node, prev)
+            prev = node
+
+    def find(self, value):
+        # Time Complexity ==> O(1) with track_index, else O(n)
+        # Space Complexity ==> O(1)
+
+        # With duplicates, returns the first node in list order, with or without the index
+        if self._index is not None:
+            bucket = self._index.get(self._index_key(value))
+            return next(iter(bucket.values())) if bucket else None
+
+        for node in self._iter_nodes():
+            if node.data == value:
+                return node
+        return None
+
+    def __contains__(self, value):
+        return self.find(value) is not None
+
+    def delete_value(self, value):
+        # Time Complexity ==> O(1) with track_index, else O(n)
+        # Space Complexity ==> O(1)
+
+        # Removes one occurrence, see find() for which one
+        node = self.find(value)
+        if node is None:
+            return "Value not found"
+
+        if self._index is not None:
+            prev = self._prev[id(node)]
+        else:
+            prev = None
+            temp = self.head
+            while temp is not node:
+                prev, temp = temp, temp.next
+
+        if prev is None:
+            self.delete_front()
+        else:
+            prev.next = node.next
+            if node is self.tail:
+                self.tail = prev
+
+            self._delete_node(node)
+            self._release_node(node)
+            self._verify_mutation()
+
+        return f"Value {value} Deleted"
+
+    def index_footprint(self):
+        # Bytes held by the value index, 0 when disabled
+        if self._index is None:
+            return 0
+
+        return (sys.getsizeof(self._index) + sys.getsizeof(self._prev)
+                + sum(sys.getsizeof(bucket) for bucket in self._index.values()))
     
+    def __reduce__(self):
+        # Instrumented lists live in a generated subclass, pickle them as the plain class
+        return getattr(type(self), '_plain_class', type(self)), (), self.__getstate__()
+
+    def __getstate__(self):
+        # Flat state, pickling the nodes would recurse once per node through .next
+        state = {
+            'values': [node.data for node in self._iter_nodes()],
+            'track_nodes': self.debug_data is not None,
+            'instrument': self._stats is not None,
+            'pool_size': self.pool_size,
+            'track_index': self._index is not None,
+            'index_key': self.index_key,
+            'verify': self.verify,
+            'verify_every': self.verify_every,
+        }
+        if 'repr_limit' in self.__dict__:
+            state['repr_limit'] = self.repr_limit
+        return state
+
+    def __setstate__(self, state):
+        self.__init__(state['values'], track_nodes=state['track_nodes'],
+                      instrument=state['instrument'], pool_size=state['pool_size'],
+                      track_index=state['track_index'], index_key=state['index_key'],
+                      verify=state.get('verify', 'cheap'), verify_every=state.get('verify_every', 1024))
+        if 'repr_limit' in state:
+            self.repr_limit = state['repr_limit']
+
+    def dump(self, path, typecode='q'):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(DUMP_CHUNK)
+
+        # Binary format for numeric lists: header + values packed as array(typecode)
+        byteorder = b'<' if sys.byteorder == 'little' else b'>'
+
+        with open(path, 'wb') as file:
+            file.write(DUMP_HEADER.pack(DUMP_MAGIC, DUMP_VERSION, typecode.encode(), byteorder, self.length))
+
+            values = (node.data for node in self._iter_nodes())
+            while True:
+                chunk = array.array(typecode, itertools.islice(values, DUMP_CHUNK))
+                if not chunk:
+                    break
+                file.write(chunk.tobytes())
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1) besides the nodes, values are read straight from the mapping
+
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            magic, version, typecode, byteorder, length = DUMP_HEADER.unpack_from(mapped)
+            assert magic == DUMP_MAGIC and version == DUMP_VERSION, f'Not a LinkedList dump: {path}'
+
+            typecode = typecode.decode()
+            start = DUMP_HEADER.size
+            end = start + length * array.array(typecode).itemsize
+            if len(mapped) < end:
+                raise ValueError(f'Truncated LinkedList dump: {path} holds {len(mapped)} bytes, header needs {end}')
+            native = byteorder == (b'<' if sys.byteorder == 'little' else b'>')
+
+            with memoryview(mapped)[start:end] as raw:
+                if native:
+                    with raw.cast(typecode) as values:  # zero-copy view of the file
+                        lst = cls(values, **kwargs)
+                else:
+                    values = array.array(typecode)
+                    values.frombytes(raw)
+                    values.byteswap()
+                    lst = cls(values, **kwargs)
+
+        return lst
+
+    @staticmethod
+    def _read_fields(fileobj, chunk_size, delimiter):
+        # Stripped, non-empty fields. Newlines also end a field, so each chunk
+        # splits into whole fields and only the one cut by the chunk boundary
+        # is carried over, even when the whole file is a single CSV line
+        partial = ''
+        separator = delimiter or '\n'
+
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if delimiter:
+                chunk = chunk.replace('\n', delimiter)
+            fields = (partial + chunk).split(separator)
+            partial = fields.pop() if chunk else ''
+
+            for field in fields:
+                field = field.strip()
+                if field:
+                    yield field
+
+            if not chunk:
+                break
+
+    @classmethod
+    def from_file(cls, path, parser=int, chunk_size=STREAM_CHUNK, delimiter=None, **kwargs):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(chunk_size) besides the nodes
+
+        # One value per line, or delimiter separated values on each line
+        # (e.g. ',' for simple CSV, no quoting). parser turns a field into a value.
+        with open(path) as file:
+            fields = cls._read_fields(file, chunk_size, delimiter)
+            return cls.from_iterable((parser(field) for field in fields), **kwargs)
+
+    def to_file(self, path, delimiter='\n', chunk_size=1 << 14, buffer_size=STREAM_CHUNK):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(chunk_size + buffer_size)
+
+        # Inverse of from_file(): chunk_size values joined per write,
+        # reaching the disk in buffer_size blocks
+        with open(path, 'w', buffering=buffer_size) as file:
+            written = self.write_to(file, chunk_size, separator=delimiter)
+            if written:
+                file.write('\n')
+
+        return written
+
+    @instrumented
+    def memory_footprint(self):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        # payload_bytes counts shared objects (e.g. small ints) once per node
+        bytes_per_node = sys.getsizeof(Node(None))
+        payload_bytes = 0
+        temp_head = self.head
+
+        while temp_head is not None:
+            payload_bytes += sys.getsizeof(temp_head.data)
+            temp_head = temp_head.next
+
+        self._count_hops(self.length)
+
+        registry_bytes = 0
+        if self.debug_data is not None:
+            # the dict behind the WeakValueDictionary plus one id key and weakref per entry
+            refs = self.debug_data.data
+            registry_bytes = sys.getsizeof(refs) + sum(sys.getsizeof(key) + sys.getsizeof(ref)
+                                                       for key, ref in refs.items())
+        index_bytes = self.index_footprint()
+        node_bytes = bytes_per_node * self.length
+
+        return {
+            'nodes': self.length,
+            'bytes_per_node': bytes_per_node,
+            'node_bytes': node_bytes,
+            'payload_bytes': payload_bytes,
+            'registry_bytes': registry_bytes,
+            'registry_bytes_per_node': registry_bytes // self.length if self.length else 0,
+            'index_bytes': index_bytes,
+            'total_bytes': node_bytes + payload_bytes + registry_bytes + index_bytes,
+        }
+
+    @instrumented
+    def leak_report(self):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(n)
+
+        # Tracked nodes still alive but no longer reachable from head: something
+        # unlinked them without unregistering and still holds a reference
+        if self.debug_data is None:
+            return "Node tracking is disabled"
+
+        reachable = {id(node) for node in itertools.islice(self._iter_nodes(), self.length)}
+        self._count_hops(len(reachable))
+        return [node for key, node in self.debug_data.items() if key not in reachable]
+
+    def debug_find_cycle(self):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        # Floyd's tortoise and hare: returns None for a proper list,
+        # else (index of the node where the cycle starts, cycle length)
+        slow = fast = self.head
+
+        while fast is not None and fast.next is not None:
+            slow = slow.next
+            fast = fast.next.next
+            if slow is fast:
+                break
+        else:
+            return None
+
+        cycle_length = 1
+        temp = slow.next
+        while temp is not slow:
+            temp = temp.next
+            cycle_length += 1
+
+        start_index = 0
+        temp = self.head
+        while temp is not slow:
+            temp = temp.next
+            slow = slow.next
+            start_index += 1
+
+        return start_index, cycle_length
+
+    def _check_invariants(self):
+        # Time Complexity ==> O(1)
+
+        if self.length == 0:
+            assert self.head is None
+            assert self.tail is None
+            return
+
+        assert self.head is not None
+        assert self.tail is not None
+        assert self.tail.next is None
+        assert (self.head is self.tail) == (self.length == 1)
+        if self.debug_data is not None:
+            assert self.length == len(self.debug_data)
+        if self._index is not None:
+            assert self.length == len(self._prev)
+
+    def _verify_mutation(self):
+        # Called at the end of every mutation, see VERIFY_LEVELS
+        if self.verify == 'off':
+            return
+
+        self._mutations += 1
+        if self.verify == 'full' or (self.verify_every and self._mutations % self.verify_every == 0):
+            self.debug_verify_data_integrity()
+        else:
+            self.cheap_checks += 1
+            self._check_invariants()
+
+    def verify_report(self):
+        return {
+            'level': self.verify,
+            'every': self.verify_every,
+            'mutations': self._mutations,
+            'cheap_checks': self.cheap_checks,
+            'full_checks': self.full_checks,
+        }
+
+    @instrumented
     def debug_verify_data_integrity(self):
+        # Time Complexity ==> O(n), always the full walk regardless of level
+        self.full_checks += 1
+
         if self.length == 0:
             assert self.head is None
             assert self.tail is None
@@ -76,17 +675,30 @@ class LinkedList:
         elif self.length == 2:
             assert self.head.next == self.tail
         else:
+            cycle = self.debug_find_cycle()
+            assert cycle is None, f'Cycle of length {cycle[1]} starts at node {cycle[0]}'
+
             actual_lst_len = 0
             temp_head = self.head
 
             while temp_head is not None:
                 temp_head = temp_head.next
                 actual_lst_len += 1
-                assert actual_lst_len < 1000  # Consider infinite cycle
 
+            self._count_hops(actual_lst_len * 5 // 2)  # ~1.5n for Floyd + n for the walk
             assert self.length == actual_lst_len
-            assert self.length == len(self.debug_data)
+            if self.debug_data is not None:
+                assert self.length == len(self.debug_data)
+            if self._index is not None:
+                assert self.length == len(self._prev)
+                assert self.length == sum(len(bucket) for bucket in self._index.values())
     
+    def _iter_nodes(self):
+        temp_head = self.head
+        while temp_head is not None:
+            yield temp_head
+            temp_head = temp_head.next
+
     def debug_print_node(self, node):
         if node is None:
             print('None')
@@ -107,7 +719,12 @@ class LinkedList:
         if msg:
             print(msg)
 
-        for node in self.debug_data:
+        if self.debug_data is not None:
+            nodes = self.debug_data.values()
+        else:
+            nodes = self._iter_nodes()
+
+        for node in nodes:
             self.debug_print_node(node)
 
         print('*******************')
@@ -115,11 +732,14 @@ class LinkedList:
         self.debug_verify_data_integrity()
         
         
+    @instrumented
     def delete_front(self): # without depend on  Length
         
         # Time Complexity ==> O(1)
         # Space Complexity ==> O(1)
         
+        removed = self.head
+        
         if not self.head: # Empty List
             return "Linked List is Empty"
         
@@ -133,13 +753,18 @@ class LinkedList:
         else: # Multiple Nodes
             self.head = self.head.next
             
-        self._delete_node(self.head)
+        self._delete_node(removed)
+        self._release_node(removed)
+        self._verify_mutation()
     
+    @instrumented
     def delete_last(self): # without depend on  Length
         
         # Time Complexity ==> O(1)
         # Space Complexity ==> O(1)
         
+        removed = self.tail
+        
         if not self.head: # Empty List
             return "Linked List is Empty"
         
@@ -158,16 +783,117 @@ class LinkedList:
                 prev = temp
                 temp = temp.next
             
+            self._count_hops(self.length - 1)
             self.tail = prev
             self.tail.next = None
             
-        self._delete_node(self.head)
+        self._delete_node(removed)
+        self._release_node(removed)
+        self._verify_mutation()
+
+    @staticmethod
+    def _take_run(start, less):
+        # Cuts the longest non-descending run off the front: (first, last, rest)
+        node = start
+        while node.next is not None and not less(node.next, node):
+            node = node.next
+
+        rest = node.next
+        node.next = None
+        return start, node, rest
+
+    @staticmethod
+    def _merge_runs(a, b, less):
+        # Stable merge of two cut runs: ties keep the node from a first
+        dummy = tail = Node(None)
+
+        while a is not None and b is not None:
+            if less(b, a):
+                tail.next, b = b, b.next
+            else:
+                tail.next, a = a, a.next
+            tail = tail.next
+
+        tail.next = a if a is not None else b
+        while tail.next is not None:
+            tail = tail.next
+
+        return dummy.next, tail
+
+    @instrumented
+    def sort(self, key=None, reverse=False):
+        # Time Complexity ==> O(n log r) for r natural runs, O(n) if already sorted
+        # Space Complexity ==> O(n) references to undo a failed sort (plus the keys),
+        #                      the nodes themselves are relinked, not copied
+
+        # Bottom-up natural merge sort: every pass merges neighbouring runs in pairs
+        if self.length < 2:
+            return
+
+        # Like list.sort(): a key or comparison that raises midway leaves the
+        # list exactly as it was, so the current order is kept until we finish
+        nodes = list(self._iter_nodes())
+
+        if key is None:
+            value = lambda node: node.data
+        else:
+            # key runs once per node, before anything is relinked
+            keys = {id(node): key(node.data) for node in nodes}
+            value = lambda node: keys[id(node)]
 
+        if reverse:
+            less = lambda x, y: value(y) < value(x)
+        else:
+            less = lambda x, y: value(x) < value(y)
+
+        try:
+            self._merge_passes(less)
+        except BaseException:
+            for node, successor in zip(nodes, itertools.islice(nodes, 1, None)):
+                node.next = successor
+            nodes[-1].next = None
+            self.head, self.tail = nodes[0], nodes[-1]
+            raise
+
+        if self._index is not None:
+            self._rebuild_index()
+        self._verify_mutation()
+
+    def _merge_passes(self, less):
+        # Merge passes over the chain from self.head until a single run is left
+        while True:
+            runs = 0
+            new_head = new_tail = None
+            rest = self.head
+
+            while rest is not None:
+                a, a_last, rest = self._take_run(rest, less)
+
+                if rest is None:
+                    head, tail = a, a_last
+                else:
+                    b, _, rest = self._take_run(rest, less)
+                    head, tail = self._merge_runs(a, b, less)
+
+                if new_tail is None:
+                    new_head = head
+                else:
+                    new_tail.next = head
+                new_tail = tail
+                runs += 1
+
+            self.head, self.tail = new_head, new_tail
+            self._count_hops(self.length)
+
+            if runs == 1:
+                break
+
+    @instrumented
     def delete_node_nth(self, node):
         # Time Complexity ==> O(n)
         # Space Complexity ==> O(1)
         
-        if node < 0 or node > self.length:
+        if node < 0 or node >= self.length:
             return "Invalid Node"
         
         elif node == 0:
@@ -179,18 +905,23 @@ class LinkedList:
             return "Last Item Deleted"
             
         else:
-            temp=self.head
-            prev=None
-            steps= 0
+            prev=self.head
+            steps= 1
             
+            # stop at the node before, then unlink once
             while steps != node:
-                prev = temp
-                temp = temp.next
-                prev.next = temp.next
-                self._delete_node(temp)
+                prev = prev.next
                 steps += 1
-                    
-            return f"Node {steps} with value {temp} Deleted"
+            
+            temp = prev.next
+            prev.next = temp.next
+            self._delete_node(temp)
+            self._count_hops(steps)
+            
+            message = f"Node {steps} with value {temp} Deleted"
+            self._release_node(temp)
+            self._verify_mutation()
+            return message
         
         
     
@@ -389,31 +1120,814 @@ def test15():
     lst.debug_print_existing_nodes()
     assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
     print('PASSED\n')
-    
-if __name__ == '__main__':
-    # Delete Front
-    # test1()
-    # test2()
-    # test3()
-    # test4()
-    # test5()
-    
-    # Delete Last
-    # test6()
-    # test7()
-    # test8()
-    # test9()
-    # test10()
-    
-    # Delete nth
-    test11()
-    test12()
-    test13()
-    test14()
-    test15()
-    
-    
 
+def test16():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40])
+
+    lst.delete_node_nth(1)
+    lst.debug_print_existing_nodes()
+    result = ', '.join(str(node) for node in lst.debug_data.values())
+    expected = "10, 30, 40"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test17():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40], track_nodes=False)
+
+    lst.delete_node_nth(1)
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.length} | {lst.debug_data}'
+    expected = "10, 30, 40 | 3 | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test18():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20])
+
+    lst.extend(iter([30, 40]))
+    lst.extend([])
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.length} | {lst.tail}'
+    expected = "10, 20, 30, 40 | 4 | 40"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test19():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList.from_iterable(range(5000))
+
+    lst.debug_verify_data_integrity()
+    result = f'{lst.head} | {lst.tail} | {lst.length}'
+    expected = "0 | 4999 | 5000"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test20():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40, 50])
+
+    nodes = list(lst.debug_data.values())
+    nodes[4].next = nodes[2]
+    result = str(lst.debug_find_cycle())
+    expected = "(2, 3)"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test21():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40, 50])
+
+    nodes = list(lst.debug_data.values())
+    nodes[3].next = nodes[1]
+    try:
+        lst.debug_verify_data_integrity()
+        result = 'No cycle found'
+    except AssertionError as error:
+        result = str(error)
+    expected = "Cycle of length 3 starts at node 1"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test22():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30], track_nodes=False)
+
+    footprint = lst.memory_footprint()
+    result = f"{hasattr(lst.head, '__dict__')} | {footprint['node_bytes'] == 3 * sys.getsizeof(lst.head)}"
+    result += f" | {footprint['total_bytes'] == footprint['node_bytes'] + footprint['payload_bytes']}"
+    # the default registry costs more per node than the node itself
+    tracked = LinkedList([10, 20, 30]).memory_footprint()
+    result += f" | {footprint['registry_bytes_per_node']} | {tracked['registry_bytes_per_node'] > tracked['bytes_per_node']}"
+    expected = "False | True | True | 0 | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test23():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(100))
+
+    lst.repr_limit = 3
+    result = str(lst)
+    expected = "0, 1, 2, ... 96 more ..., 99"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test24():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(10))
+
+    lst.repr_limit = 3
+    output = io.StringIO()
+    written = lst.write_to(output, chunk_size=4)
+    lst.repr_limit = None
+    result = f'{output.getvalue() == str(lst)} | {written}'
+    expected = "True | 10"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test25():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40], instrument=True)
+
+    lst.reset_stats()
+    lst.delete_last()
+    lst.delete_last()
+    stats = lst.stats()
+    result = f"{sorted(stats)} | {stats['delete_last']['calls']} | {stats['delete_last']['hops']}"
+    result += f" | {sum(stats['delete_last']['histogram'].values())}"
+    expected = "['delete_last'] | 2 | 5 | 2"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test26():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30])
+
+    lst.insert_end(40)
+    result = f'{lst.stats()} | {lst}'
+    expected = "{} | 10, 20, 30, 40"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test27():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3], pool_size=2)
+
+    # queue churn: every insert after the first delete reuses a pooled node
+    for value in range(4, 104):
+        lst.delete_front()
+        lst.insert_end(value)
+
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.pool_stats()}'
+    expected = "101, 102, 103 | {'pooled': 0, 'pool_size': 2, 'hits': 100, 'misses': 3}"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test28():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40, 50], pool_size=2)
+
+    removed = lst.tail
+    lst.delete_last()
+    lst.delete_node_nth(2)
+    lst.delete_front()
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {removed.data} | {removed.next} | {lst.pool_stats()}'
+    expected = "20, 40 | None | None | {'pooled': 2, 'pool_size': 2, 'hits': 0, 'misses': 5}"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test29():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40, 50])
+
+    message = lst.delete_node_nth(3)
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {message} | {lst.delete_node_nth(4)}'
+    expected = "10, 20, 30, 50 | Node 3 with value 40 Deleted | Invalid Node"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test30():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(100000), pool_size=4)
+
+    lst.repr_limit = 2
+    copy = pickle.loads(pickle.dumps(lst))
+    copy.debug_verify_data_integrity()
+    result = f'{copy} | {copy.length} | {copy.pool_size} | {len(copy.debug_data)}'
+    expected = "0, 1, ... 99997 more ..., 99999 | 100000 | 4 | 100000"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test31():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    ints = LinkedList([10, -20, 30, 2**40])
+    floats = LinkedList([0.5, 1.25])
+
+    with tempfile.TemporaryDirectory() as folder:
+        ints.dump(f'{folder}/ints.bin')
+        floats.dump(f'{folder}/floats.bin', typecode='d')
+        LinkedList([]).dump(f'{folder}/empty.bin')
+
+        loaded = [LinkedList.load(f'{folder}/{name}.bin') for name in ('ints', 'floats', 'empty')]
+
+    result = ' | '.join(f'[{lst}]' for lst in loaded)
+    expected = "[10, -20, 30, 1099511627776] | [0.5, 1.25] | []"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test32():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([40, 10, 30, 20, 50, 10])
+
+    nodes = set(lst.debug_data)
+    lst.sort()
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.tail} | {nodes == set(lst.debug_data)}'
+    expected = "10, 10, 20, 30, 40, 50 | 50 | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test33():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    words = ['bb', 'a', 'cc', 'd', 'ee', 'f']
+    lst = LinkedList(words)
+
+    lst.sort(key=len, reverse=True)
+    descending = str(lst)
+    lst.sort(key=len)
+    result = f'{descending} | {lst} | {lst.tail}'
+    expected = f"{', '.join(sorted(words, key=len, reverse=True))} | {', '.join(sorted(words, key=len))} | ee"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test34():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(1000), instrument=True)
+
+    # already sorted: a single pass finds one run
+    lst.reset_stats()
+    lst.sort()
+    stats = lst.stats()
+    result = f"{stats['sort']['hops']} | {sorted(stats)} | {lst.head} | {lst.tail}"
+    expected = "1000 | ['sort'] | 0 | 999"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test35():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 10, 30, 40], track_index=True)
+
+    messages = [lst.delete_value(10), lst.delete_value(40), lst.delete_value(99)]
+    lst.insert_end(50)
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.tail} | {10 in lst} | {40 in lst} | {messages}'
+    expected = "20, 10, 30, 50 | 50 | True | False | ['Value 10 Deleted', 'Value 40 Deleted', 'Value not found']"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test36():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(['b1', 'a1', 'c1', 'a2'], track_index=True, index_key=lambda value: value[0])
+
+    lst.sort()
+    lst.delete_value('a')     # first value in list order with key 'a'
+    lst.delete_node_nth(1)
+    lst.delete_front()
+    lst.debug_print_existing_nodes()
+    result = f"{lst} | {lst.find('c')} | {lst.find('a')} | {lst.memory_footprint()['index_bytes'] > 0}"
+    expected = "c1 | c1 | None | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test37():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30])
+
+    # without the index the same API falls back to walking
+    message = lst.delete_value(30)
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {lst.tail} | {20 in lst} | {message} | {lst.index_footprint()}'
+    expected = "10, 20 | 20 | True | Value 30 Deleted | 0"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test38():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3])
+
+    if numpy is None:
+        try:
+            lst.to_numpy()
+            result = 'exported'
+        except ImportError as error:
+            result = str(error)
+        expected = "to_numpy() requires numpy"
+    else:
+        values = lst.to_numpy()   # dtype inferred, ints are not turned into floats
+        copy = LinkedList.from_numpy(values * 10)
+        copy.debug_verify_data_integrity()
+        halves = LinkedList([0.5, 1]).to_numpy()
+        result = f'{values.tolist()} | {values.dtype} | {copy} | {copy.length} | {halves.dtype}'
+        result += f" | {lst.to_numpy(dtype='f').dtype}"
+        expected = "[1, 2, 3] | int64 | 10, 20, 30 | 3 | float64 | float32"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test39():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(3), verify='cheap', verify_every=4)
+
+    for value in range(3, 7):
+        lst.insert_end(value)   # the 4th mutation runs the full walk
+    lst.delete_front()
+    lst.debug_verify_data_integrity()   # on demand
+    result = f'{lst} | {lst.verify_report()}'
+    expected = ("1, 2, 3, 4, 5, 6 | {'level': 'cheap', 'every': 4, 'mutations': 6, "
+                "'cheap_checks': 5, 'full_checks': 2}")
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test40():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    results = []
+
+    for verify in ('off', 'cheap'):
+        lst = LinkedList([1, 2, 3], verify=verify, verify_every=None)
+        lst.tail.next = lst.head    # corrupt: tail no longer ends the chain
+        try:
+            lst.delete_front()
+            results.append('missed')
+        except AssertionError:
+            results.append('caught')
+        results.append(lst.verify_report()['full_checks'])
+
+    result = str(results)
+    expected = "['missed', 0, 'caught', 0]"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test41():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3])
+
+    # the registry alone must not keep a deleted node alive
+    deleted = weakref.ref(lst.head)
+    lst.delete_front()
+    freed = deleted() is None
+
+    # unlinked behind the list's back while something still holds it
+    stray = lst.head
+    lst.head = stray.next
+    lst.length -= 1
+    leaked = str(lst.leak_report())
+    del stray
+    result = f'{freed} | {leaked} | {lst.leak_report()} | {len(lst.debug_data)}'
+    expected = "True | [2] | [] | 1"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test42():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(100))
+
+    tracemalloc.start()
+    for value in range(2000):  # warm up dict / allocator sizes
+        lst.insert_end(value)
+        lst.delete_front()
+    before = tracemalloc.get_traced_memory()[0]
+
+    for value in range(20000):
+        lst.insert_end(value)
+        lst.delete_front()
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    result = f'{growth < 16 * 1024} | {lst.length} | {len(lst.debug_data)} | {lst.leak_report()}'
+    expected = "True | 100 | 100 | []"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test43():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    ints = LinkedList([10, -20, 30, 400000, 5])
+    floats = LinkedList([0.5, -1.25, 3.0])
+
+    with tempfile.TemporaryDirectory() as folder:
+        # tiny chunks so values are cut across reads
+        written = ints.to_file(f'{folder}/ints.txt', chunk_size=2)
+        floats.to_file(f'{folder}/floats.csv', delimiter=',')
+        with open(f'{folder}/floats.csv') as file:
+            csv_text = file.read()
+
+        loaded = [LinkedList.from_file(f'{folder}/ints.txt', chunk_size=3),
+                  LinkedList.from_file(f'{folder}/floats.csv', parser=float, chunk_size=4, delimiter=',')]
+
+    result = f'{written} | {csv_text!r} | ' + ' | '.join(f'[{lst}]' for lst in loaded)
+    expected = "5 | '0.5,-1.25,3.0\\n' | [10, -20, 30, 400000, 5] | [0.5, -1.25, 3.0]"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test44():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    def squares(n):
+        for i in range(n):
+            yield i * i
+
+    generated = LinkedList.from_iter(squares(5), pool_size=2)
+
+    with tempfile.TemporaryDirectory() as folder:
+        LinkedList(range(50000)).to_file(f'{folder}/big.txt')
+        with open(f'{folder}/blank.txt', 'w') as file:
+            file.write('\n\n  \n')
+
+        # transient memory is bounded by the chunk, not by the file size
+        tracemalloc.start()
+        big = LinkedList.from_file(f'{folder}/big.txt', chunk_size=1024, track_nodes=False)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blank = LinkedList.from_file(f'{folder}/blank.txt')
+
+    result = f'{generated} | {generated.pool_size} | {big.length} | {big.tail} | {peak - current < 64 * 1024} | [{blank}]'
+    expected = "0, 1, 4, 9, 16 | 2 | 50000 | 49999 | True | []"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test45():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(5))
+
+    lst.repr_limit = 0
+    result = f'{lst} | {LinkedList([7])}'
+    lst.repr_limit = -1
+    try:
+        result += f' | {lst}'
+    except AssertionError as error:
+        result += f' | {error}'
+    expected = "... 4 more ..., 4 | 7 | repr_limit must be None or >= 0, got -1"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test46():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    plain = LinkedList([1, 2])
+    recorded = LinkedList([1, 2], instrument=True)
+
+    # only instrumented lists go through the recording wrappers
+    recorded.insert_end(3)
+    copy = pickle.loads(pickle.dumps(recorded))
+    result = f"{hasattr(type(plain).insert_end, '__wrapped__')} | {hasattr(type(recorded).insert_end, '__wrapped__')}"
+    result += f" | {isinstance(recorded, LinkedList)} | {recorded.stats()['insert_end']['calls']}"
+    result += f" | {type(copy) is type(recorded)} | {copy}"
+    expected = "False | True | True | 1 | True | 1, 2, 3"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test47():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = f'{folder}/cut.bin'
+        LinkedList(range(100)).dump(path)
+        with open(path, 'r+b') as file:
+            file.truncate(DUMP_HEADER.size + 40 * 8)  # keep 40 of 100 values
+
+        try:
+            result = f'loaded {LinkedList.load(path).length}'
+        except ValueError as error:
+            result = str(error).replace(folder, '')
+
+    # pickling is not a recorded operation, memory_footprint is
+    result += f" | {getattr(LinkedList.__getstate__, '_instrumented', False)}"
+    result += f" | {getattr(LinkedList.memory_footprint, '_instrumented', False)}"
+    expected = "Truncated LinkedList dump: /cut.bin holds 336 bytes, header needs 816 | False | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test48():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    # the ', ' delimiter and the numbers get cut by 3 character chunks
+    fields = list(LinkedList._read_fields(io.StringIO('10, 20\n30, 40\n'), 3, ', '))
+
+    with tempfile.TemporaryDirectory() as folder:
+        LinkedList(range(50000)).to_file(f'{folder}/row.csv', delimiter=',')
+
+        # one CSV line: transient memory is still bounded by the chunk
+        tracemalloc.start()
+        row = LinkedList.from_file(f'{folder}/row.csv', chunk_size=1024, delimiter=',', track_nodes=False)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    result = f'{fields} | {row.length} | {[node.data for node in row._iter_nodes()] == list(range(50000))} | {peak - current < 64 * 1024}'
+    expected = "['10', '20', '30', '40'] | 50000 | True | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test49():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3])
+
+    def broken():
+        yield 4
+        yield 5
+        raise ValueError('source failed')
+
+    try:
+        lst.extend(broken())
+        outcome = 'extended'
+    except ValueError as error:
+        outcome = str(error)
+    # values linked before the failure stay, the list is still consistent
+    lst.insert_end(6)
+    lst.debug_verify_data_integrity()
+    result = f'{outcome} | {lst} | {lst.length} | {lst.tail}'
+    expected = "source failed | 1, 2, 3, 4, 5, 6 | 6 | 6"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test50():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([3, 1, 'a', 2, 0], track_index=True)
+
+    outcomes = []
+    for kwargs in ({}, {'key': lambda value: 1 / value}, {'reverse': True}):
+        try:
+            lst.sort(**kwargs)
+            outcomes.append('sorted')
+        except (TypeError, ZeroDivisionError) as error:
+            outcomes.append(type(error).__name__)
+        lst.debug_verify_data_integrity()
+
+    # a failed sort leaves the order, tail and predecessor index untouched
+    unchanged = f'{lst} | {lst.tail}'
+    lst.delete_value('a')
+    lst.sort()
+    result = f"{', '.join(outcomes)} | {unchanged} | {lst} | {lst.tail} | {lst.length}"
+    expected = "TypeError, TypeError, TypeError | 3, 1, a, 2, 0 | 0 | 0, 1, 2, 3 | 3 | 4"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test51():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2], track_index=True)
+
+    outcomes = []
+    for insert in (lst.insert_end, lambda value: lst.extend([3, value])):
+        try:
+            insert([1])
+            outcomes.append('inserted')
+        except TypeError:
+            outcomes.append('TypeError')
+    lst.debug_verify_data_integrity()
+    result = f"{', '.join(outcomes)} | {lst} | {lst.length} | {len(lst.debug_data)} | {3 in lst} | {lst.delete_value(3)}"
+    expected = "TypeError, TypeError | 1, 2, 3 | 3 | 3 | True | Value 3 Deleted"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test52():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    # 1 and 1.0 are equal duplicates; sorting floats first moves 1.0 ahead of 1
+    found = []
+    for track_index in (True, False):
+        lst = LinkedList([3, 1, 2, 1.0], track_index=track_index)
+        lst.sort(key=lambda value: not isinstance(value, float))
+        first = lst.find(1).data
+        lst.delete_value(1)
+        lst.debug_verify_data_integrity()
+        found.append(f'{first!r} {lst}')
+
+    result = ' | '.join(found)
+    expected = "1.0 3, 1, 2 | 1.0 3, 1, 2"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+
+def benchmark_construction(sizes=(10**3, 10**4, 10**5, 10**6, 10**7)):
+    # Construction should stay linear: the per-element cost must not grow with n
+    for size in sizes:
+        start = time.perf_counter()
+        lst = LinkedList(range(size))
+        elapsed = time.perf_counter() - start
+
+        print(f'n={size:<10} total={elapsed:.3f}s per_element={elapsed / size * 1e9:.0f}ns')
+        del lst
+
+
+def benchmark_tracking(size=10**6):
+    # What the default node registry costs: build time and bytes per node, tracked vs. not
+    for track_nodes in (True, False):
+        start = time.perf_counter()
+        lst = LinkedList(range(size), track_nodes=track_nodes)
+        elapsed = time.perf_counter() - start
+
+        footprint = lst.memory_footprint()
+        per_node = (footprint['node_bytes'] + footprint['registry_bytes']) / size
+        print(f'track_nodes={track_nodes!s:<6} build={elapsed:.2f}s  node+registry={per_node:.0f}B/node'
+              f'  registry={footprint["registry_bytes_per_node"]}B/node')
+        del lst
+
+
+def benchmark_memory_flat(cycles=10**7, report_every=10**6):
+    # Traced memory across insert/delete cycles should stay flat, not grow with cycles
+    lst = LinkedList(range(1000))
+    tracemalloc.start()
+
+    start = time.perf_counter()
+    for cycle in range(1, cycles + 1):
+        lst.insert_end(cycle)
+        lst.delete_front()
+
+        if cycle % report_every == 0:
+            current, peak = tracemalloc.get_traced_memory()
+            print(f'cycles={cycle:<10} current={current / 1024:8.1f}KiB peak={peak / 1024:8.1f}KiB'
+                  f' elapsed={time.perf_counter() - start:.1f}s')
+
+    tracemalloc.stop()
+    print(f'leaked nodes: {len(lst.leak_report())}')
+
+
+if __name__ == '__main__':
+    # Delete Front
+    # test1()
+    # test2()
+    # test3()
+    # test4()
+    # test5()
+    
+    # Delete Last
+    # test6()
+    # test7()
+    # test8()
+    # test9()
+    # test10()
+    
+    # Delete nth
+    test11()
+    test12()
+    test13()
+    test14()
+    test15()
+    
+    
+
+    # Node registry
+    test16()
+    test17()
+    
+    # Bulk construction
+    test18()
+    test19()
+    # benchmark_construction()
+    
+    # Cycle detection
+    test20()
+    test21()
+    
+    # Memory footprint
+    test22()
+    
+    # Repr / streaming export
+    test23()
+    test24()
+    
+    # Instrumentation
+    test25()
+    test26()
+    
+    # Node pool
+    test27()
+    test28()
+    test29()
+    
+    # Serialization
+    test30()
+    test31()
+    
+    # Sort
+    test32()
+    test33()
+    test34()
+    
+    # Value index
+    test35()
+    test36()
+    test37()
+    
+    # NumPy bridge
+    test38()
+    
+    
+    # Tiered verification
+    test39()
+    test40()
+    
+    
+    # Weak node tracking / leaks
+    test41()
+    test42()
+    # benchmark_memory_flat()
+    
+    
+    # Streaming ingestion / export
+    test43()
+    test44()
+    
+    
+    # Repr limit edge cases
+    test45()
+    
+    
+    # Instrumentation off the hot path
+    test46()
+    
+    
+    # Truncated dump
+    test47()
+    
+    
+    # Single-line CSV streaming
+    test48()
+    
+    
+    # Failing source in extend
+    test49()
+    
+    
+    # Failed sort leaves the list unchanged
+    test50()
+    
+    
+    # Unhashable values with track_index
+    test51()
+    
+    
+    # Duplicates found in list order after sort
+    test52()
+    
+    
     # Must see to insure no RTE
     print('ALL CASES PASSED')
 
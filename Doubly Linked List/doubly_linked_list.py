@@ -0,0 +1,401 @@
+import inspect
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from linked_list_loader import load_linked_list  # noqa: E402
+
+
+class Node:
+    __slots__ = ('data', 'next', 'prev')  # no per-instance __dict__
+
+    def __init__(self, data, next=None, prev=None):
+        self.data = data
+        self.next = next
+        self.prev = prev
+
+    def __repr__(self):
+        return f'{self.data}'
+
+
+class DoublyLinkedList:
+    def __init__(self, initial_values=None, track_nodes=True):
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+        # id(node) -> node, dicts keep insertion order and add/remove in O(1)
+        # track_nodes=False skips the bookkeeping entirely
+        self.debug_data = {} if track_nodes else None
+
+        if initial_values:
+            self.extend(initial_values)
+
+    def __repr__(self):
+        return ', '.join(str(node.data) for node in self)
+
+    def __iter__(self):
+        temp_head = self.head
+        while temp_head is not None:
+            yield temp_head
+            temp_head = temp_head.next
+
+    def __reversed__(self):
+        # Time Complexity ==> O(1) per step
+        temp_tail = self.tail
+        while temp_tail is not None:
+            yield temp_tail
+            temp_tail = temp_tail.prev
+
+    def _add_node(self, node):
+        if self.debug_data is not None:
+            self.debug_data[id(node)] = node
+        self.length += 1
+
+    def _delete_node(self, node):
+        if self.debug_data is not None and self.debug_data.pop(id(node), None) is None:
+            print("Node does't exist!!")
+            return
+
+        self.length -= 1
+
+    def _get_nth(self, n):
+        # Time Complexity ==> O(min(n, length - n))
+
+        # Walk from whichever end is closer
+        if n < self.length // 2:
+            temp = self.head
+            for _ in range(n):
+                temp = temp.next
+        else:
+            temp = self.tail
+            for _ in range(self.length - 1 - n):
+                temp = temp.prev
+        return temp
+
+    def extend(self, values):
+        # Time Complexity ==> O(k)
+        # Space Complexity ==> O(1)
+
+        tail = self.tail
+
+        for value in values:
+            node = Node(value, prev=tail)
+            self._add_node(node)
+
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+
+        self.tail = tail
+        self.debug_verify_data_integrity()
+
+    def insert_end(self, value):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        node = Node(value, prev=self.tail)
+        self._add_node(node)
+
+        if not self.head:
+            self.head = self.tail = node
+        else:
+            self.tail.next = node
+            self.tail = node
+
+    def insert_front(self, value):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        node = Node(value, next=self.head)
+        self._add_node(node)
+
+        if not self.head:
+            self.head = self.tail = node
+        else:
+            self.head.prev = node
+            self.head = node
+
+    def delete_front(self):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        if not self.head:  # Empty List
+            return "Linked List is Empty"
+
+        node = self.head
+        self.head = node.next
+
+        if self.head is None:
+            self.tail = None
+        else:
+            self.head.prev = None
+
+        node.next = None
+        self._delete_node(node)
+
+    def delete_last(self):
+        # Time Complexity ==> O(1), prev gives the new tail directly
+        # Space Complexity ==> O(1)
+
+        if not self.head:  # Empty List
+            return "Linked List is Empty"
+
+        node = self.tail
+        self.tail = node.prev
+
+        if self.tail is None:
+            self.head = None
+        else:
+            self.tail.next = None
+
+        node.prev = None
+        self._delete_node(node)
+
+    def delete_node_nth(self, node):
+        # Time Complexity ==> O(min(n, length - n))
+        # Space Complexity ==> O(1)
+
+        if node < 0 or node >= self.length:
+            return "Invalid Node"
+
+        elif node == 0:
+            self.delete_front()
+            return "First Item Deleted"
+
+        elif node == self.length - 1:
+            self.delete_last()
+            return "Last Item Deleted"
+
+        temp = self._get_nth(node)
+        temp.prev.next = temp.next
+        temp.next.prev = temp.prev
+        temp.next = temp.prev = None
+        self._delete_node(temp)
+
+        return f"Node {node} with value {temp} Deleted"
+
+    def get_nth_back(self, n):
+        # Time Complexity ==> O(n), walking back from tail
+        # Space Complexity ==> O(1)
+
+        if n > self.length or n <= 0:
+            return None
+
+        temp = self.tail
+        for _ in range(n - 1):
+            temp = temp.prev
+
+        return temp
+
+    def memory_footprint(self):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        # payload_bytes counts shared objects (e.g. small ints) once per node
+        bytes_per_node = sys.getsizeof(Node(None))
+        payload_bytes = sum(sys.getsizeof(node.data) for node in self)
+        registry_bytes = 0 if self.debug_data is None else sys.getsizeof(self.debug_data)
+        node_bytes = bytes_per_node * self.length
+
+        return {
+            'nodes': self.length,
+            'bytes_per_node': bytes_per_node,
+            'node_bytes': node_bytes,
+            'payload_bytes': payload_bytes,
+            'registry_bytes': registry_bytes,
+            'total_bytes': node_bytes + payload_bytes + registry_bytes,
+        }
+
+    def debug_verify_data_integrity(self):
+        if self.length == 0:
+            assert self.head is None
+            assert self.tail is None
+            return
+
+        assert self.head is not None
+        assert self.tail is not None
+        assert self.head.prev is None
+        assert self.tail.next is None
+
+        # Every next must be mirrored by a prev, so a cycle cannot close
+        # without breaking this check before walking more than length nodes
+        actual_lst_len = 0
+        prev = None
+        temp_head = self.head
+
+        while temp_head is not None:
+            assert temp_head.prev is prev
+            prev = temp_head
+            temp_head = temp_head.next
+            actual_lst_len += 1
+            assert actual_lst_len <= self.length  # Consider infinite cycle
+
+        assert prev is self.tail
+        assert self.length == actual_lst_len
+        if self.debug_data is not None:
+            assert self.length == len(self.debug_data)
+
+    def debug_print_node(self, node):
+        if node is None:
+            print('None')
+            return
+
+        prev_value = 'None' if node.prev is None else str(node.prev.data)
+        print(prev_value.rjust(5), end=' <- ')
+        print(str(node.data).ljust(5), end=' -> ')
+        next_value = 'None' if node.next is None else str(node.next.data)
+        print(next_value.ljust(5), end='\t')
+
+        if node == self.head:
+            print("head")
+        elif node == self.tail:
+            print("tail")
+        else:
+            print("")
+
+    def debug_print_existing_nodes(self, msg=None):
+        if msg:
+            print(msg)
+
+        nodes = self.debug_data.values() if self.debug_data is not None else self
+
+        for node in nodes:
+            self.debug_print_node(node)
+
+        print('*******************')
+        self.debug_verify_data_integrity()
+
+
+def compare_with_singly(size=10**5, pops=1000):
+    # Extra prev pointer: bytes per node vs. the singly linked list in Delete/
+    SinglyLinkedList = load_linked_list()
+
+    for name, cls in (('singly', SinglyLinkedList), ('doubly', DoublyLinkedList)):
+        lst = cls(range(size), track_nodes=False)
+        footprint = lst.memory_footprint()
+
+        start = time.perf_counter()
+        for _ in range(pops):
+            lst.delete_last()
+        elapsed = time.perf_counter() - start
+
+        print(f"{name}: {footprint['bytes_per_node']} bytes/node, "
+              f"{footprint['node_bytes']} node bytes, "
+              f"delete_last {elapsed / pops * 1e6:.2f}us/op at n={size}")
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = DoublyLinkedList([10, 20, 30])
+
+    lst.insert_front(5)
+    lst.insert_end(40)
+    lst.debug_print_existing_nodes()
+    result = str(lst)
+    expected = "5, 10, 20, 30, 40"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = DoublyLinkedList([])
+
+    result = f'{lst.delete_front()} | {lst.delete_last()}'
+    expected = "Linked List is Empty | Linked List is Empty"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = DoublyLinkedList([10, 20, 30, 40])
+
+    lst.delete_last()
+    lst.delete_last()
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.tail} | {lst.length}'
+    expected = "10, 20 | 20 | 2"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = DoublyLinkedList([10])
+
+    lst.delete_last()
+    lst.debug_verify_data_integrity()
+    lst.insert_end(20)
+    lst.delete_front()
+    lst.debug_verify_data_integrity()
+    result = f'[{lst}] | {lst.length}'
+    expected = "[] | 0"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test5():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = DoublyLinkedList([10, 20, 30, 40, 50])
+
+    first = lst.delete_node_nth(1)
+    second = lst.delete_node_nth(2)
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {first} | {second}'
+    expected = "10, 30, 50 | Node 1 with value 20 Deleted | Node 2 with value 40 Deleted"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test6():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = DoublyLinkedList([6, 10, 8, 15])
+
+    backwards = ', '.join(str(node) for node in reversed(lst))
+    result = f'{backwards} | {lst.get_nth_back(2)} | {lst.get_nth_back(5)}'
+    expected = "15, 8, 10, 6 | 8 | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test7():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = DoublyLinkedList([10, 20, 30])
+
+    lst.head.next.prev = None  # broken back link
+    try:
+        lst.debug_verify_data_integrity()
+        result = 'Not detected'
+    except AssertionError:
+        result = 'Detected'
+    expected = "Detected"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # insert front / end
+    test2()  # empty list
+    test3()  # delete last twice
+    test4()  # one element
+    test5()  # delete nth
+    test6()  # backwards iteration, get nth back
+    test7()  # broken prev pointer
+
+    # compare_with_singly()
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
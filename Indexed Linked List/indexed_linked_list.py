@@ -0,0 +1,366 @@
+import inspect
+import random
+
+MAX_LEVEL = 32  # enough for 2 ** 32 elements with p = 1/2
+
+
+class Node:
+    __slots__ = ('data', 'nexts', 'widths')
+
+    def __init__(self, data, level):
+        self.data = data
+        self.nexts = [None] * level   # nexts[0] is the plain linked list
+        self.widths = [0] * level     # how many positions nexts[lvl] skips
+
+    @property
+    def next(self):
+        return self.nexts[0]
+
+    def __repr__(self):
+        return f'{self.data}'
+
+
+class IndexedLinkedList:
+    # Indexable skip list: level 0 is an ordinary singly linked list and
+    # the upper levels are express lanes annotated with their span, so a
+    # position can be reached in O(log n) expected hops.
+
+    def __init__(self, initial_values=None, track_nodes=True, seed=None):
+        self._header = Node(None, MAX_LEVEL)  # position 0, element i is at i + 1
+        self.level = 1
+        self.tail = None
+        self.length = 0
+
+        # id(node) -> node, dicts keep insertion order and add/remove in O(1)
+        # track_nodes=False skips the bookkeeping entirely
+        self.debug_data = {} if track_nodes else None
+
+        # Private generator for node levels, seed makes the layout reproducible
+        # without touching the global random state
+        self._rng = random.Random(seed)
+
+        if initial_values:
+            self.extend(initial_values)
+
+    @property
+    def head(self):
+        return self._header.nexts[0]
+
+    def __iter__(self):
+        temp_head = self.head
+        while temp_head is not None:
+            yield temp_head
+            temp_head = temp_head.nexts[0]
+
+    def __repr__(self):
+        return ', '.join(str(node.data) for node in self)
+
+    def _add_node(self, node):
+        if self.debug_data is not None:
+            self.debug_data[id(node)] = node
+        self.length += 1
+
+    def _delete_node(self, node):
+        if self.debug_data is not None and self.debug_data.pop(id(node), None) is None:
+            print("Node does't exist!!")
+            return
+
+        self.length -= 1
+
+    def _random_level(self):
+        level = 1
+        while level < MAX_LEVEL and self._rng.random() < 0.5:
+            level += 1
+        return level
+
+    def _predecessors(self, index):
+        # Time Complexity ==> O(log n) expected
+
+        # Last node at position <= index on every level, and its position
+        chain = [None] * self.level
+        steps = [0] * self.level
+        node = self._header
+        pos = 0
+
+        for lvl in range(self.level - 1, -1, -1):
+            while node.nexts[lvl] is not None and pos + node.widths[lvl] <= index:
+                pos += node.widths[lvl]
+                node = node.nexts[lvl]
+            chain[lvl] = node
+            steps[lvl] = pos
+
+        return chain, steps
+
+    def extend(self, values):
+        # Time Complexity ==> O(k log n) expected
+        for value in values:
+            self.insert(self.length, value)
+
+        self.debug_verify_data_integrity()
+
+    def get_nth(self, index):
+        # Time Complexity ==> O(log n) expected
+        # Space Complexity ==> O(1)
+
+        if index < 0 or index >= self.length:
+            return None
+
+        node = self._header
+        pos = 0
+        target = index + 1
+
+        for lvl in range(self.level - 1, -1, -1):
+            while node.nexts[lvl] is not None and pos + node.widths[lvl] <= target:
+                pos += node.widths[lvl]
+                node = node.nexts[lvl]
+
+        return node
+
+    def get_nth_back(self, n):
+        # Time Complexity ==> O(log n) expected
+        # Space Complexity ==> O(1)
+
+        if n > self.length or n <= 0:
+            return None
+
+        return self.get_nth(self.length - n)
+
+    def insert(self, index, value):
+        # Time Complexity ==> O(log n) expected
+        # Space Complexity ==> O(log n) expected for the new node's lanes
+
+        if index < 0 or index > self.length:
+            return "Invalid Position"
+
+        level = self._random_level()
+        self.level = max(self.level, level)
+        chain, steps = self._predecessors(index)
+        node = Node(value, level)
+
+        for lvl in range(self.level):
+            prev = chain[lvl]
+
+            if lvl < level:
+                node.nexts[lvl] = prev.nexts[lvl]
+                node.widths[lvl] = prev.widths[lvl] - (index - steps[lvl])
+                prev.nexts[lvl] = node
+                prev.widths[lvl] = index + 1 - steps[lvl]
+            else:
+                prev.widths[lvl] += 1  # lane now jumps over one more element
+
+        if node.nexts[0] is None:
+            self.tail = node
+
+        self._add_node(node)
+
+    def insert_end(self, value):
+        self.insert(self.length, value)
+
+    def insert_front(self, value):
+        self.insert(0, value)
+
+    def _remove_at(self, index):
+        # Time Complexity ==> O(log n) expected
+
+        chain, _ = self._predecessors(index)
+        node = chain[0].nexts[0]
+
+        for lvl in range(self.level):
+            prev = chain[lvl]
+
+            if prev.nexts[lvl] is node:
+                prev.nexts[lvl] = node.nexts[lvl]
+                prev.widths[lvl] += node.widths[lvl] - 1
+            else:
+                prev.widths[lvl] -= 1
+
+        while self.level > 1 and self._header.nexts[self.level - 1] is None:
+            self.level -= 1
+
+        if node is self.tail:
+            self.tail = None if chain[0] is self._header else chain[0]
+
+        self._delete_node(node)
+        return node
+
+    def delete_front(self):
+        if self.length == 0:
+            return "Linked List is Empty"
+
+        self._remove_at(0)
+
+    def delete_last(self):
+        if self.length == 0:
+            return "Linked List is Empty"
+
+        self._remove_at(self.length - 1)
+
+    def delete_node_nth(self, node):
+        # Time Complexity ==> O(log n) expected
+        # Space Complexity ==> O(log n) expected
+
+        if node < 0 or node >= self.length:
+            return "Invalid Node"
+
+        elif node == 0:
+            self.delete_front()
+            return "First Item Deleted"
+
+        elif node == self.length - 1:
+            self.delete_last()
+            return "Last Item Deleted"
+
+        removed = self._remove_at(node)
+        return f"Node {node} with value {removed} Deleted"
+
+    def debug_verify_data_integrity(self):
+        if self.length == 0:
+            assert self.head is None
+            assert self.tail is None
+            return
+
+        assert self.head is not None
+        assert self.tail is not None
+        assert self.tail.next is None
+
+        # Level 0 is the real list
+        positions = {}
+        temp_head = self.head
+        while temp_head is not None:
+            positions[id(temp_head)] = len(positions) + 1
+            assert len(positions) <= self.length  # Consider infinite cycle
+            last = temp_head
+            temp_head = temp_head.nexts[0]
+
+        assert last is self.tail
+        assert self.length == len(positions)
+        if self.debug_data is not None:
+            assert self.length == len(self.debug_data)
+
+        # Every express lane must land where its width says
+        for lvl in range(self.level):
+            node = self._header
+            pos = 0
+            while node.nexts[lvl] is not None:
+                pos += node.widths[lvl]
+                node = node.nexts[lvl]
+                assert positions.get(id(node)) == pos, f'Bad width on level {lvl}'
+
+    def debug_print_existing_nodes(self, msg=None):
+        if msg:
+            print(msg)
+
+        nodes = self.debug_data.values() if self.debug_data is not None else self
+
+        for node in nodes:
+            next_value = 'None' if node.next is None else str(node.next.data)
+            print(str(node.data).ljust(5), '->', next_value.ljust(5), f'levels={len(node.nexts)}')
+
+        print('*******************')
+        self.debug_verify_data_integrity()
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = IndexedLinkedList([10, 20, 30])
+
+    lst.insert_front(5)
+    lst.insert_end(40)
+    lst.insert(2, 15)
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.head} | {lst.tail} | {lst.length}'
+    expected = "5, 10, 15, 20, 30, 40 | 5 | 40 | 6"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = IndexedLinkedList([6, 10, 8, 15])
+
+    result = f'{lst.get_nth(0)} | {lst.get_nth(3)} | {lst.get_nth(4)} | {lst.get_nth_back(2)} | {lst.get_nth_back(5)}'
+    expected = "6 | 15 | None | 8 | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = IndexedLinkedList([10, 20, 30, 40])
+
+    messages = [lst.delete_node_nth(-1), lst.delete_node_nth(0), lst.delete_node_nth(2), lst.delete_node_nth(1)]
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {messages}'
+    expected = "20 | ['Invalid Node', 'First Item Deleted', 'Last Item Deleted', 'Last Item Deleted']"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = IndexedLinkedList([10])
+
+    lst.delete_last()
+    lst.debug_verify_data_integrity()
+    result = f'[{lst}] | {lst.delete_front()} | {lst.head} | {lst.tail}'
+    expected = "[] | Linked List is Empty | None | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test5():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    rng = random.Random(7)
+    lst = IndexedLinkedList(range(200), seed=7)
+    shadow = list(range(200))
+
+    # random positional inserts / deletes against a python list
+    for step in range(2000):
+        if shadow and rng.random() < 0.5:
+            index = rng.randrange(len(shadow))
+            lst.delete_node_nth(index)
+            del shadow[index]
+        else:
+            index = rng.randrange(len(shadow) + 1)
+            lst.insert(index, step)
+            shadow.insert(index, step)
+
+        probe = rng.randrange(len(shadow)) if shadow else 0
+        assert (lst.get_nth(probe).data if shadow else None) == (shadow[probe] if shadow else None)
+
+    lst.debug_verify_data_integrity()
+    result = str([node.data for node in lst] == shadow)
+    expected = "True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test6():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    state = random.getstate()
+
+    # same seed, same tower heights; the global generator is left alone
+    levels = [[len(node.nexts) for node in IndexedLinkedList(range(50), seed=3)] for _ in range(2)]
+    result = f'{levels[0] == levels[1]} | {random.getstate() == state}'
+    expected = "True | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # positional inserts
+    test2()  # get nth / nth back
+    test3()  # delete nth
+    test4()  # one element
+    test5()  # random operations against a python list
+    test6()  # seeded levels, global random state untouched
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
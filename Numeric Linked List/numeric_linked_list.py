@@ -0,0 +1,294 @@
+import inspect
+import itertools
+import os
+import sys
+import time
+from array import array
+
+try:
+    import numpy
+except ImportError:  # optional, only to_numpy() / from_numpy() and map / filter / where need it
+    numpy = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from linked_list_loader import load_linked_list  # noqa: E402
+
+# numpy dtypes with an array.array twin; bool is stored as unsigned bytes
+NUMPY_TYPECODES = {'?': 'B', **{code: code for code in 'bBhHiIlLqQfd'}}
+
+
+def _require_numpy(name):
+    if numpy is None:
+        raise ImportError(f'{name}() requires numpy')
+
+
+class NumericLinkedList:
+    # Typed numeric mode: values are kept in list order in one array.array,
+    # so they are unboxed, contiguous and exported through the buffer protocol.
+    # delete_front only advances self.start; the dead prefix is compacted
+    # once it outgrows the live part (amortized O(1)).
+    #
+    # An exported buffer (to_numpy(), memoryview) pins the array: growing or
+    # compacting it raises BufferError until the export is released.
+
+    def __init__(self, initial_values=None, typecode='d'):
+        self.typecode = typecode
+        self.values = array(typecode)
+        self.start = 0  # index of the head value in self.values
+
+        if initial_values:
+            self.extend(initial_values)
+
+    @classmethod
+    def from_numpy(cls, values):
+        # Time Complexity ==> O(n), one memcpy
+        _require_numpy('from_numpy')
+
+        typecode = NUMPY_TYPECODES.get(values.dtype.char)
+        if typecode is None:
+            raise ValueError(f'from_numpy() has no array typecode for dtype {values.dtype}')
+
+        # native byte order and layout, so the bytes are what array() expects
+        values = numpy.ascontiguousarray(values, dtype=numpy.dtype(typecode).newbyteorder('='))
+        lst = cls(typecode=typecode)
+        lst.values.frombytes(values.tobytes())
+        return lst
+
+    def _wrap(self, values, typecode=None):
+        lst = NumericLinkedList(typecode=typecode or self.typecode)
+        lst.values.frombytes(numpy.asarray(values).astype(lst.typecode, copy=False).tobytes())
+        return lst
+
+    @property
+    def length(self):
+        return len(self.values) - self.start
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return itertools.islice(self.values, self.start, None)
+
+    def __repr__(self):
+        return ', '.join(map(str, self))
+
+    def to_numpy(self):
+        # Time Complexity ==> O(1), a view over the list's own buffer
+        _require_numpy('to_numpy')
+
+        itemsize = self.values.itemsize
+        return numpy.frombuffer(self.values, dtype=self.typecode, offset=self.start * itemsize)
+
+    def extend(self, values):
+        # Time Complexity ==> O(k)
+        self.values.extend(values)
+
+    def insert_end(self, value):
+        # Time Complexity ==> O(1) amortized
+        # Space Complexity ==> O(1)
+        self.values.append(value)
+
+    def insert_front(self, value):
+        # Time Complexity ==> O(1) into space left by delete_front, else O(n)
+        # Space Complexity ==> O(1)
+
+        if self.start > 0:
+            self.start -= 1
+            self.values[self.start] = value
+        else:
+            self.values.insert(0, value)
+
+    def delete_front(self):
+        # Time Complexity ==> O(1) amortized
+        # Space Complexity ==> O(1)
+
+        if self.length == 0:
+            return "Linked List is Empty"
+
+        self.start += 1
+        if self.start > self.length:
+            del self.values[:self.start]
+            self.start = 0
+
+    def delete_last(self):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        if self.length == 0:
+            return "Linked List is Empty"
+
+        self.values.pop()
+        if self.length == 0:
+            del self.values[:]
+            self.start = 0
+
+    def get_nth_back(self, n):
+        # Time Complexity ==> O(1)
+
+        if n > self.length or n <= 0:
+            return None
+
+        return self.values[len(self.values) - n]
+
+    def is_identical_to(self, lst):
+        if self.length != lst.length:
+            return False
+
+        return all(a == b for a, b in zip(self, lst))
+
+    # Vectorized bulk operations: func / predicate always receive the whole
+    # numpy array once (ufunc-style, e.g. lambda x: x * 2 or numpy.sqrt,
+    # combine conditions with & and |), never single values. They need numpy.
+
+    def sum(self):
+        # Same result either way, builtin sum() over the buffer without numpy
+        if numpy is not None:
+            return self.to_numpy().sum().item()
+
+        return sum(self)
+
+    def map(self, func, typecode=None):
+        _require_numpy('map')
+        return self._wrap(func(self.to_numpy()), typecode)
+
+    def filter(self, predicate):
+        # Values where the boolean mask predicate(values) holds, in order
+        _require_numpy('filter')
+        values = self.to_numpy()
+        return self._wrap(values[predicate(values)])
+
+    def where(self, predicate, other):
+        # Like numpy.where: keep values where predicate holds, else other
+        _require_numpy('where')
+        values = self.to_numpy()
+        return self._wrap(numpy.where(predicate(values), values, other))
+
+    def debug_verify_data_integrity(self):
+        assert 0 <= self.start <= len(self.values)
+        assert self.length == len(self.values) - self.start
+        if self.length == 0:
+            assert self.start == 0
+
+
+def benchmark_bulk_ops(size=10**7):
+    # Sum / filter-count over Node chain vs. the contiguous numeric buffer
+    LinkedList = load_linked_list()
+    lst = LinkedList(range(size), track_nodes=False)
+    numeric = NumericLinkedList(range(size), typecode='q')
+
+    start = time.perf_counter()
+    total = sum(node.data for node in lst._iter_nodes())
+    evens = sum(1 for node in lst._iter_nodes() if node.data % 2 == 0)
+    print(f'LinkedList         {time.perf_counter() - start:.3f}s  sum={total} evens={evens}')
+
+    start = time.perf_counter()
+    total = numeric.sum()
+    evens = numeric.filter(lambda x: x % 2 == 0).length
+    print(f'NumericLinkedList  {time.perf_counter() - start:.3f}s  sum={total} evens={evens}')
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = NumericLinkedList([1, 2, 3], typecode='q')
+
+    lst.insert_end(4)
+    lst.insert_front(0)
+    lst.delete_front()
+    lst.delete_front()
+    lst.insert_front(-1)   # reuses the slot freed by delete_front
+    lst.delete_last()
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {lst.length} | {lst.get_nth_back(1)} | {len(lst.values)}'
+    expected = "-1, 2, 3 | 3 | 3 | 4"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = NumericLinkedList(range(10), typecode='q')
+
+    for _ in range(6):
+        lst.delete_front()  # compacts once the dead prefix outgrows the rest
+    lst.debug_verify_data_integrity()
+    empty = NumericLinkedList()
+    result = f'{lst} | {lst.start} | {empty.delete_front()} | {empty.delete_last()} | {empty.get_nth_back(1)}'
+    expected = "6, 7, 8, 9 | 0 | Linked List is Empty | Linked List is Empty | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = NumericLinkedList(range(-3, 7), typecode='q')
+    lst.delete_front()
+
+    if numpy is None:
+        errors = []
+        for name, call in (('map', lambda: lst.map(abs)), ('filter', lambda: lst.filter(bool)),
+                           ('where', lambda: lst.where(bool, 0))):
+            try:
+                call()
+                errors.append(f'{name} ran')
+            except ImportError as error:
+                errors.append(str(error))
+        result = f"{lst.sum()} | {', '.join(errors)}"
+        expected = "18 | map() requires numpy, filter() requires numpy, where() requires numpy"
+    else:
+        # the callables see the whole array: ufuncs and & / | masks
+        with numpy.errstate(invalid='ignore'):  # sqrt of the negatives is nan, no warning
+            roots = lst.map(numpy.sqrt, typecode='d').filter(lambda x: ~numpy.isnan(x))
+        doubled = lst.map(lambda x: x * 2)
+        middle = lst.filter(lambda x: (x > 1) & (x < 5))
+        clipped = lst.where(lambda x: x > 0, 0)
+        result = f'{lst.sum()} | {roots.length} | {doubled} | {middle} | {clipped}'
+        expected = "18 | 7 | -4, -2, 0, 2, 4, 6, 8, 10, 12 | 2, 3, 4 | 0, 0, 0, 1, 2, 3, 4, 5, 6"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = NumericLinkedList([1.5, 2.5, 3.5])
+    lst.delete_front()
+
+    if numpy is None:
+        try:
+            lst.to_numpy()
+            result = 'exported'
+        except ImportError as error:
+            result = str(error)
+        expected = "to_numpy() requires numpy"
+    else:
+        view = lst.to_numpy()
+        view[0] = 9.0         # writes through, no copy was made
+        copy = NumericLinkedList.from_numpy(view * 2)
+        del view
+        flags = NumericLinkedList.from_numpy(numpy.array([True, False]))
+        swapped = NumericLinkedList.from_numpy(numpy.arange(3, dtype='>i4'))
+        try:
+            NumericLinkedList.from_numpy(numpy.zeros(2, dtype='e'))
+            half = 'imported'
+        except ValueError as error:
+            half = str(error)
+        result = f'{lst} | {copy} | {copy.typecode} | {flags} {flags.typecode} | {swapped} | {half}'
+        expected = "9.0, 3.5 | 18.0, 7.0 | d | 1, 0 B | 0, 1, 2 | from_numpy() has no array typecode for dtype float16"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # insert / delete at both ends
+    test2()  # compaction, empty list
+    test3()  # sum / map / filter / where
+    test4()  # zero-copy export, dtype mapping
+
+    # benchmark_bulk_ops()
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
@@ -0,0 +1,217 @@
+import array
+import inspect
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from linked_list_loader import load_linked_list  # noqa: E402
+
+SNAPSHOT_CHUNK = 1 << 16  # values copied into shared memory per step
+COMBINE = {'sum': sum, 'count': sum, 'min': min, 'max': max}
+
+
+def _reduce_chunk(name, typecode, start, end, op, predicate):
+    # Runs in a worker: attach to the snapshot, reduce values[start:end]
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast(typecode) as values, values[start:end] as chunk:
+            if op == 'sum':
+                return sum(chunk)
+            if op == 'min':
+                return min(chunk)
+            if op == 'max':
+                return max(chunk)
+            return sum(1 for value in chunk if predicate(value))
+    finally:
+        shm.close()
+
+
+class SharedSnapshot:
+    # Copies the values of a linked list into one shared-memory buffer, so
+    # worker processes read them without pickling or walking nodes.
+
+    def __init__(self, lst, typecode=None):
+        # typecode=None: 'q' when every value is an int, so integer sums stay
+        # exact (a value beyond 64 bits raises OverflowError), else 'd'
+        if typecode is None:
+            typecode = 'q' if all(isinstance(node.data, int) for node in _iter_nodes(lst)) else 'd'
+
+        self.typecode = typecode
+        self.length = lst.length
+        itemsize = array.array(typecode).itemsize
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, self.length * itemsize))
+
+        # Single walk from head, packed in chunks. A value the typecode
+        # rejects must not leave the segment behind in /dev/shm.
+        try:
+            nodes = _iter_nodes(lst)
+            offset = 0
+            while True:
+                chunk = array.array(typecode, (node.data for node in itertools.islice(nodes, SNAPSHOT_CHUNK)))
+                if not chunk:
+                    break
+                self.shm.buf[offset:offset + len(chunk) * itemsize] = chunk.tobytes()
+                offset += len(chunk) * itemsize
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def reduce(self, op, predicate=None, executor=None, workers=None):
+        # op: 'sum', 'min', 'max' or 'count' (values where predicate(value) is true).
+        # predicate must be picklable, e.g. a module level function.
+        # workers sizes our own pool and the split (4 chunks per worker), it
+        # defaults to os.cpu_count(); pass it too when handing in an executor.
+        assert op in COMBINE, f'Unknown reduction {op}'
+        assert op != 'count' or predicate is not None, 'count needs a predicate'
+
+        if self.length == 0:
+            return None if op in ('min', 'max') else 0
+
+        workers = workers or os.cpu_count() or 1
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+        try:
+            chunks = workers * 4
+            step = -(-self.length // chunks)
+            futures = [
+                executor.submit(_reduce_chunk, self.shm.name, self.typecode,
+                                start, min(start + step, self.length), op, predicate)
+                for start in range(0, self.length, step)
+            ]
+            return COMBINE[op](future.result() for future in futures)
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+
+def _iter_nodes(lst):
+    temp_head = lst.head
+    while temp_head is not None:
+        yield temp_head
+        temp_head = temp_head.next
+
+
+def parallel_reduce(lst, op, predicate=None, typecode=None, workers=None):
+    # One-shot helper: snapshot, fan out to a process pool, combine
+    with SharedSnapshot(lst, typecode) as snapshot:
+        return snapshot.reduce(op, predicate=predicate, workers=workers)
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+def benchmark_scaling(size=10**7, worker_counts=(1, 2, 4, 8)):
+    # Wall time of a sum over one snapshot, single walk vs. process pools
+    LinkedList = load_linked_list()
+    lst = LinkedList(range(size), track_nodes=False)
+
+    start = time.perf_counter()
+    total = sum(node.data for node in _iter_nodes(lst))
+    print(f'single walk      {time.perf_counter() - start:.3f}s  sum={total}')
+
+    with SharedSnapshot(lst, 'q') as snapshot:
+        for workers in worker_counts:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                snapshot.reduce('sum', executor=executor, workers=workers)  # warm up the workers
+                start = time.perf_counter()
+                total = snapshot.reduce('sum', executor=executor, workers=workers)
+                print(f'workers={workers:<8} {time.perf_counter() - start:.3f}s  sum={total}')
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    LinkedList = load_linked_list()
+    lst = LinkedList(range(1, 10001), track_nodes=False)
+
+    with SharedSnapshot(lst, 'q') as snapshot:
+        results = [snapshot.reduce(op, predicate=is_even, workers=2) for op in ('sum', 'min', 'max', 'count')]
+
+    result = str(results)
+    expected = "[50005000, 1, 10000, 5000]"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    LinkedList = load_linked_list()
+
+    results = [parallel_reduce(LinkedList([0.5, -1.5, 4.0]), 'sum', workers=3),
+               parallel_reduce(LinkedList([]), 'max'),
+               parallel_reduce(LinkedList([]), 'sum')]
+    result = str(results)
+    expected = "[3.0, None, 0]"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    LinkedList = load_linked_list()
+    before = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+    # 1.5 does not fit typecode 'q': the half-built segment must be unlinked
+    try:
+        SharedSnapshot(LinkedList([1, 2, 1.5]), 'q')
+        outcome = 'packed'
+    except TypeError:
+        outcome = 'TypeError'
+    after = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+    total = parallel_reduce(LinkedList(range(100)), 'sum', workers=2)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        with SharedSnapshot(LinkedList(range(10)), 'q') as snapshot:
+            shared = snapshot.reduce('max', executor=executor, workers=2)
+
+    result = f'{outcome} | {sorted(after - before)} | {total} | {shared}'
+    expected = "TypeError | [] | 4950 | 9"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    LinkedList = load_linked_list()
+
+    # 2**53 + 1 has no exact float: the inferred 'q' keeps it, 'd' rounds it away
+    values = LinkedList([2**53, 1])
+    with SharedSnapshot(values) as inferred, SharedSnapshot(LinkedList([1, 2.5])) as mixed:
+        typecodes = f'{inferred.typecode} {mixed.typecode}'
+    result = f"{typecodes} | {parallel_reduce(values, 'sum', workers=2)} | {parallel_reduce(values, 'sum', typecode='d', workers=2)}"
+    expected = f"q d | {2**53 + 1} | {float(2**53)}"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # every reduction over one snapshot
+    test2()  # floats, empty list
+    test3()  # failed packing unlinks, external executor
+    test4()  # typecode inferred from the values
+
+    # benchmark_scaling()
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
@@ -0,0 +1,333 @@
+import inspect
+import sys
+import threading
+import time
+
+
+class Node:
+    # Immutable once built, so any number of versions can share it
+    __slots__ = ('data', 'next')  # no per-instance __dict__
+
+    def __init__(self, data, next=None):
+        object.__setattr__(self, 'data', data)
+        object.__setattr__(self, 'next', next)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Node is immutable')
+
+    def __repr__(self):
+        return f'{self.data}'
+
+
+class Snapshot:
+    # One frozen version of the list. Holding it costs O(1): it only
+    # references a head that later versions keep sharing.
+    __slots__ = ('head', 'tail', 'length')
+
+    def __init__(self, head=None, tail=None, length=0):
+        self.head = head
+        self.tail = tail
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def _iter_nodes(self):
+        temp_head = self.head
+        while temp_head is not None:
+            yield temp_head
+            temp_head = temp_head.next
+
+    def __iter__(self):
+        return (node.data for node in self._iter_nodes())
+
+    def __repr__(self):
+        return ', '.join(map(str, self))
+
+    def get_nth_back(self, n):
+        # Time Complexity ==> O(n)
+
+        if n > self.length or n <= 0:
+            return None
+
+        temp_head = self.head
+        for _ in range(self.length - n):
+            temp_head = temp_head.next
+        return temp_head.data
+
+    def is_identical_to(self, lst):
+        if self.length != lst.length:
+            return False
+
+        return all(a == b for a, b in zip(self, lst))
+
+    def debug_print_node(self, node):
+        if node is None:
+            print('None')
+            return
+
+        print(str(node.data).ljust(5), end=' -> ')
+        next_value = 'None' if node.next is None else str(node.next.data)
+        print(next_value.ljust(5), end='\t')
+
+        if node is self.head:
+            print("head")
+        elif node is self.tail:
+            print("tail")
+        else:
+            print("")
+
+    def debug_print_existing_nodes(self, msg=None):
+        if msg:
+            print(msg)
+
+        for node in self._iter_nodes():
+            self.debug_print_node(node)
+
+        print('*******************')
+
+        self.debug_verify_data_integrity()
+
+    def debug_verify_data_integrity(self):
+        if self.length == 0:
+            assert self.head is None
+            assert self.tail is None
+            return
+
+        assert self.head is not None
+        assert self.tail is not None
+        assert self.tail.next is None
+
+        actual_lst_len = 0
+        last = None
+        for node in self._iter_nodes():
+            actual_lst_len += 1
+            assert actual_lst_len <= self.length  # Consider infinite cycle
+            last = node
+
+        assert last is self.tail
+        assert self.length == actual_lst_len
+
+
+class PersistentLinkedList:
+    # Copy-on-write list: every write builds a new Snapshot that shares all
+    # untouched nodes with the previous one and publishes it with a single
+    # attribute store. Readers never lock; they take snapshot() (or call the
+    # read methods below, which do) and see one consistent version while
+    # writers continue. Writers are serialized by one lock.
+
+    def __init__(self, initial_values=None):
+        self._lock = threading.Lock()
+        self._version = Snapshot()
+
+        if initial_values:
+            self.extend(initial_values)
+
+    def snapshot(self):
+        # Time Complexity ==> O(1)
+        return self._version
+
+    @property
+    def head(self):
+        return self._version.head
+
+    @property
+    def tail(self):
+        return self._version.tail
+
+    @property
+    def length(self):
+        return self._version.length
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __repr__(self):
+        return repr(self.snapshot())
+
+    def get_nth_back(self, n):
+        return self.snapshot().get_nth_back(n)
+
+    def is_identical_to(self, lst):
+        return self.snapshot().is_identical_to(lst)
+
+    def debug_print_existing_nodes(self, msg=None):
+        self.snapshot().debug_print_existing_nodes(msg)
+
+    def debug_verify_data_integrity(self):
+        self.snapshot().debug_verify_data_integrity()
+
+    def extend(self, values):
+        # Time Complexity ==> O(n + k), the existing spine is copied once
+        # Space Complexity ==> O(n + k)
+
+        with self._lock:
+            version = self._version
+            values = list(version) + list(values)
+
+            head = tail = None
+            for value in reversed(values):
+                head = Node(value, head)
+                if tail is None:
+                    tail = head
+
+            self._version = Snapshot(head, tail, len(values))
+
+    def insert_front(self, value):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1), the new head shares the old chain
+
+        with self._lock:
+            version = self._version
+            head = Node(value, version.head)
+            self._version = Snapshot(head, version.tail or head, version.length + 1)
+
+    def insert_end(self, value):
+        # Time Complexity ==> O(n), nodes are immutable so the spine is copied
+        # Space Complexity ==> O(n)
+        self.extend([value])
+
+    def delete_front(self):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1), older snapshots keep the removed node alive
+
+        with self._lock:
+            version = self._version
+            if version.head is None:
+                return "Linked List is Empty"
+
+            head = version.head.next
+            tail = version.tail if head is not None else None
+            self._version = Snapshot(head, tail, version.length - 1)
+
+
+def shared_nodes(a, b):
+    # Time Complexity ==> O(len(a) + len(b))
+
+    # Nodes referenced by both snapshots, i.e. memory not duplicated
+    ids = {id(node) for node in a._iter_nodes()}
+    return sum(1 for node in b._iter_nodes() if id(node) in ids)
+
+
+def benchmark_snapshots(size=10**5, versions=1000):
+    # Memory of keeping `versions` snapshots vs. full copies per version
+    lst = PersistentLinkedList(range(size))
+    node_bytes = sys.getsizeof(lst.head)
+
+    start = time.perf_counter()
+    kept = []
+    for value in range(versions):
+        lst.insert_front(value)
+        lst.delete_front()
+        lst.delete_front()
+        kept.append(lst.snapshot())
+    elapsed = time.perf_counter() - start
+
+    shared = (size + versions) * node_bytes  # every node ever built, at most
+    copied = sum(version.length for version in kept) * node_bytes
+    print(f'{versions} snapshots in {elapsed:.3f}s   shared <= {shared / 2**20:.1f} MiB   full copies {copied / 2**20:.1f} MiB')
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = PersistentLinkedList([1, 2, 3])
+
+    before = lst.snapshot()
+    lst.insert_front(0)
+    lst.delete_front()
+    lst.delete_front()
+    lst.insert_end(4)
+    lst.debug_verify_data_integrity()
+    before.debug_verify_data_integrity()
+    result = f'{before} | {lst} | {lst.length} | {lst.get_nth_back(1)}'
+    expected = "1, 2, 3 | 2, 3, 4 | 3 | 4"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = PersistentLinkedList(range(5))
+
+    old = lst.snapshot()
+    lst.delete_front()
+    lst.insert_front(10)
+    new = lst.snapshot()
+
+    # the 4 untouched nodes are the same objects in both versions
+    try:
+        new.head.data = 0
+        mutated = 'mutated'
+    except AttributeError as error:
+        mutated = str(error)
+    result = f'{shared_nodes(old, new)} | {new.head.next is old.head.next} | {mutated}'
+    expected = "4 | True | Node is immutable"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = PersistentLinkedList([7])
+
+    lst.delete_front()
+    empty = lst.snapshot()
+    message = lst.delete_front()
+    lst.insert_front(8)
+    lst.debug_verify_data_integrity()
+    result = f'[{empty}] | {message} | {lst} | {lst.tail} | {empty.get_nth_back(1)}'
+    expected = "[] | Linked List is Empty | 8 | 8 | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = PersistentLinkedList(range(100))
+    torn = []
+
+    def write():
+        for value in range(2000):
+            lst.insert_front(value)
+            lst.delete_front()
+            lst.delete_front()
+            lst.insert_front(-value)
+
+    def read():
+        # every version a reader sees must be internally consistent
+        for _ in range(200):
+            version = lst.snapshot()
+            if len(list(version)) != version.length:
+                torn.append(version)
+
+    workers = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    lst.debug_verify_data_integrity()
+    result = f'{len(torn)} | {lst.length}'
+    expected = "0 | 100"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # old snapshot unaffected by later writes
+    test2()  # structural sharing, immutable nodes
+    test3()  # empty versions
+    test4()  # lock-free readers during writes
+
+    # benchmark_snapshots()
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
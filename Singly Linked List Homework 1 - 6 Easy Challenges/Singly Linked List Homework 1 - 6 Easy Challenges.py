@@ -1,7 +1,82 @@
+import functools
 import inspect
+import io
+import itertools
+import pickle
+import sys
+import time
+import weakref
+
+
+HASH_BASE = 1_000_003
+HASH_MOD = (1 << 61) - 1  # Mersenne prime
+HASH_BASE_INV = pow(HASH_BASE, -1, HASH_MOD)
+
+# Integrity checks after each mutation:
+#   'off'   nothing
+#   'cheap' O(1) invariants, plus a full walk every verify_every mutations
+#   'full'  a full walk every time (the old behaviour)
+VERIFY_LEVELS = ('off', 'cheap', 'full')
+
+
+def instrumented(method):
+    # Marks an operation to be recorded on lists built with instrument=True.
+    # The class keeps the plain method, so other lists pay nothing per call.
+    method._instrumented = True
+    return method
+
+
+def _recording(method):
+    # Records calls, pointer hops and a latency histogram per operation
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        hops = self._hops
+        start = time.perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            op = self._stats.get(name)
+            if op is None:
+                op = self._stats[name] = {'calls': 0, 'hops': 0, 'total_ns': 0, 'histogram': {}}
+
+            op['calls'] += 1
+            op['hops'] += self._hops - hops  # includes nested operations
+            op['total_ns'] += elapsed
+            bucket = 1 << elapsed.bit_length()  # power of two upper bound in ns
+            op['histogram'][bucket] = op['histogram'].get(bucket, 0) + 1
+
+    return wrapper
+
+
+_instrumented_classes = {}  # plain class -> generated recording subclass
+
+
+def _instrumented_class(cls):
+    # Subclass of cls overriding every @instrumented method with a recording
+    # wrapper. Built once per class; instrument=True moves the instance into it
+    # (a subclass, not instance attributes, so __repr__ is covered too).
+    if '_plain_class' in cls.__dict__:
+        return cls
+
+    recording = _instrumented_classes.get(cls)
+    if recording is None:
+        methods = {'_plain_class': cls, '__module__': cls.__module__, '__qualname__': cls.__qualname__}
+        for name in dir(cls):
+            member = getattr(cls, name)
+            if getattr(member, '_instrumented', False):
+                methods[name] = _recording(member)
+
+        recording = _instrumented_classes[cls] = type(cls.__name__, (cls,), methods)
+
+    return recording
 
 
 class Node:
+    __slots__ = ('data', 'next', '__weakref__')  # no per-instance __dict__, weakly referenceable
+
     def __init__(self, data, next=None):
         self.data = data
         self.next = next
@@ -11,25 +86,116 @@ class Node:
 
 
 class LinkedList:
-    def __init__(self, initial_values=None):
+    repr_limit = None  # max values shown by repr(), None shows all
+
+    def __init__(self, initial_values=None, track_nodes=True, track_hash=False, instrument=False,
+                 verify='cheap', verify_every=1024):
         self.head = None
         self.tail = None
         self.length = 0
 
-        self.debug_data = []  # add/remove nodes you use
+        # id(node) -> node, dicts keep insertion order and add/remove in O(1).
+        # Weak values: the registry never keeps a node alive, an entry vanishes
+        # with its node. It is not free: ~160 B per node on top of the node, see
+        # memory_footprint()['registry_bytes_per_node']. track_nodes=False skips
+        # the bookkeeping entirely
+        self.debug_data = weakref.WeakValueDictionary() if track_nodes else None
+
+        # Per-operation counters, see instrumented(). None when disabled.
+        self._stats = {} if instrument else None
+        self._hops = 0
+        if instrument:
+            self.__class__ = _instrumented_class(type(self))
+
+        # Rolling polynomial hash of the values, sum(hash(v_i) * BASE^(n-1-i)),
+        # kept up to date by every insert/delete. None when disabled.
+        self.content_hash = 0 if track_hash else None
+        self._hash_power = 1  # BASE^length
+
+        # See VERIFY_LEVELS, verify_every=None leaves full walks to on-demand calls
+        assert verify in VERIFY_LEVELS, f'verify must be one of {VERIFY_LEVELS}'
+        self.verify = verify
+        self.verify_every = verify_every
+        self._mutations = 0
+        self.cheap_checks = 0
+        self.full_checks = 0
 
         if initial_values:
-            for value in initial_values:
-                self.insert_end(value)
+            self.extend(initial_values)
+
+    @classmethod
+    def from_iterable(cls, values, track_nodes=True, track_hash=False, instrument=False,
+                      verify='cheap', verify_every=1024):
+        lst = cls(track_nodes=track_nodes, track_hash=track_hash, instrument=instrument,
+                  verify=verify, verify_every=verify_every)
+        lst.extend(values)
+        return lst
+
+    @instrumented
+    def extend(self, values):
+        # Time Complexity ==> O(k)
+        # Space Complexity ==> O(1)
+
+        # Link all values in one pass, then verify once instead of per node
+        tail = self.tail
+        hashing = self.content_hash is not None
+
+        # values may raise midway: self.tail must still end on the last linked node
+        try:
+            for value in values:
+                if hashing:
+                    self._hash_push_back(value)  # may raise (unhashable), before any change
+                node = Node(value)
+                self._add_node(node)
+
+                if tail is None:
+                    self.head = node
+                else:
+                    tail.next = node
+                tail = node
+        finally:
+            self.tail = tail
+
+        self._verify_mutation()
+
+    def _count_hops(self, hops):
+        if self._stats is not None:
+            self._hops += hops
+
+    def stats(self):
+        # Snapshot: {operation: {calls, hops, total_ns, histogram: {ns upper bound: calls}}}
+        if self._stats is None:
+            return {}
+
+        return {
+            name: {**op, 'histogram': dict(sorted(op['histogram'].items()))}
+            for name, op in self._stats.items()
+        }
+
+    def reset_stats(self):
+        if self._stats is not None:
+            self._stats = {}
+            self._hops = 0
 
     def _add_node(self, node):
-        self.debug_data.append(node)
+        if self.debug_data is not None:
+            self.debug_data[id(node)] = node
         self.length += 1
 
+    def _hash_push_back(self, value):
+        self.content_hash = (self.content_hash * HASH_BASE + hash(value)) % HASH_MOD
+        self._hash_power = self._hash_power * HASH_BASE % HASH_MOD
+
+    def _hash_push_front(self, value):
+        self.content_hash = (self.content_hash + hash(value) * self._hash_power) % HASH_MOD
+        self._hash_power = self._hash_power * HASH_BASE % HASH_MOD
+
+    def _hash_pop_front(self, value):
+        self._hash_power = self._hash_power * HASH_BASE_INV % HASH_MOD
+        self.content_hash = (self.content_hash - hash(value) * self._hash_power) % HASH_MOD
+
     def _delete_node(self, node):
-        if node in self.debug_data:
-            self.debug_data.remove(node)
-        else:
+        if self.debug_data is not None and self.debug_data.pop(id(node), None) is None:
             print("Node does't exist!!")
             return
 
@@ -63,13 +229,137 @@ class LinkedList:
         if msg:
             print(msg)
 
-        for node in self.debug_data:
+        if self.debug_data is not None:
+            nodes = self.debug_data.values()
+        else:
+            nodes = iter(self)
+
+        for node in nodes:
             self.debug_print_node(node)
 
         print('*******************')
         self.debug_verify_data_integrity()
 
+    @instrumented
+    def memory_footprint(self):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        # payload_bytes counts shared objects (e.g. small ints) once per node
+        bytes_per_node = sys.getsizeof(Node(None))
+        payload_bytes = 0
+        temp_head = self.head
+
+        while temp_head is not None:
+            payload_bytes += sys.getsizeof(temp_head.data)
+            temp_head = temp_head.next
+
+        self._count_hops(self.length)
+
+        registry_bytes = 0
+        if self.debug_data is not None:
+            # the dict behind the WeakValueDictionary plus one id key and weakref per entry
+            refs = self.debug_data.data
+            registry_bytes = sys.getsizeof(refs) + sum(sys.getsizeof(key) + sys.getsizeof(ref)
+                                                       for key, ref in refs.items())
+        node_bytes = bytes_per_node * self.length
+
+        return {
+            'nodes': self.length,
+            'bytes_per_node': bytes_per_node,
+            'node_bytes': node_bytes,
+            'payload_bytes': payload_bytes,
+            'registry_bytes': registry_bytes,
+            'registry_bytes_per_node': registry_bytes // self.length if self.length else 0,
+            'total_bytes': node_bytes + payload_bytes + registry_bytes,
+        }
+
+    @instrumented
+    def leak_report(self):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(n)
+
+        # Tracked nodes still alive but no longer reachable from head: something
+        # unlinked them without unregistering and still holds a reference
+        if self.debug_data is None:
+            return "Node tracking is disabled"
+
+        reachable = {id(node) for node in itertools.islice(iter(self), self.length)}
+        self._count_hops(len(reachable))
+        return [node for key, node in self.debug_data.items() if key not in reachable]
+
+    def debug_find_cycle(self):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(1)
+
+        # Floyd's tortoise and hare: returns None for a proper list,
+        # else (index of the node where the cycle starts, cycle length)
+        slow = fast = self.head
+
+        while fast is not None and fast.next is not None:
+            slow = slow.next
+            fast = fast.next.next
+            if slow is fast:
+                break
+        else:
+            return None
+
+        cycle_length = 1
+        temp = slow.next
+        while temp is not slow:
+            temp = temp.next
+            cycle_length += 1
+
+        start_index = 0
+        temp = self.head
+        while temp is not slow:
+            temp = temp.next
+            slow = slow.next
+            start_index += 1
+
+        return start_index, cycle_length
+
+    def _check_invariants(self):
+        # Time Complexity ==> O(1)
+
+        if self.length == 0:
+            assert self.head is None
+            assert self.tail is None
+            return
+
+        assert self.head is not None
+        assert self.tail is not None
+        assert self.tail.next is None
+        assert (self.head is self.tail) == (self.length == 1)
+        if self.debug_data is not None:
+            assert self.length == len(self.debug_data)
+
+    def _verify_mutation(self):
+        # Called at the end of every mutation, see VERIFY_LEVELS
+        if self.verify == 'off':
+            return
+
+        self._mutations += 1
+        if self.verify == 'full' or (self.verify_every and self._mutations % self.verify_every == 0):
+            self.debug_verify_data_integrity()
+        else:
+            self.cheap_checks += 1
+            self._check_invariants()
+
+    def verify_report(self):
+        return {
+            'level': self.verify,
+            'every': self.verify_every,
+            'mutations': self._mutations,
+            'cheap_checks': self.cheap_checks,
+            'full_checks': self.full_checks,
+        }
+
+    @instrumented
     def debug_verify_data_integrity(self):
+        # Time Complexity ==> O(n), always the full walk regardless of level
+        self.full_checks += 1
+
         if self.length == 0:
             assert self.head is None
             assert self.tail is None
@@ -84,21 +374,29 @@ class LinkedList:
         elif self.length == 2:
             assert self.head.next == self.tail
         else:
+            cycle = self.debug_find_cycle()
+            assert cycle is None, f'Cycle of length {cycle[1]} starts at node {cycle[0]}'
+
             actual_lst_len = 0
             temp_head = self.head
 
             while temp_head is not None:
                 temp_head = temp_head.next
                 actual_lst_len += 1
-                assert actual_lst_len < 1000  # Consider infinite cycle
 
+            self._count_hops(actual_lst_len * 5 // 2)  # ~1.5n for Floyd + n for the walk
             assert self.length == actual_lst_len
-            assert self.length == len(self.debug_data)
+            if self.debug_data is not None:
+                assert self.length == len(self.debug_data)
 
     ##############################################
 
+    @instrumented
     def insert_end(self, value):
         
+        # Hash first: an unhashable value must raise before the list changes
+        if self.content_hash is not None:
+            self._hash_push_back(value)
         node = Node(value)
         self._add_node(node)
 
@@ -108,7 +406,7 @@ class LinkedList:
             self.tail.next = node
             self.tail = node
 
-        self.debug_verify_data_integrity()  # ** verify as possible
+        self._verify_mutation()  # ** verify as possible
 
     def print(self):
         temp_head = self.head
@@ -124,24 +422,87 @@ class LinkedList:
             yield temp_head
             temp_head = temp_head.next
 
+    @instrumented
     def __repr__(self):
-        represent = ''
-        temp_head = self.head
+        # Time Complexity ==> O(n), O(repr_limit) when truncated
+        # Space Complexity ==> O(n)
 
-        while temp_head is not None:
-            represent += str(temp_head.data)
-            temp_head = temp_head.next
-            if temp_head:
-                represent += ', '
+        limit = self.repr_limit
+        assert limit is None or limit >= 0, f'repr_limit must be None or >= 0, got {limit}'
+        values = (str(node.data) for node in self)
+
+        if limit is None or self.length <= limit + 1:
+            self._count_hops(self.length)
+            return ', '.join(values)
+
+        self._count_hops(limit)
 
-        return represent
+        # first `limit` values ... tail, repr_limit=0 shows only the tail
+        represent = ''.join(f'{value}, ' for value in itertools.islice(values, limit))
+        return f'{represent}... {self.length - limit - 1} more ..., {self.tail.data}'
+
+    @instrumented
+    def write_to(self, fileobj, chunk_size=1024):
+        # Time Complexity ==> O(n)
+        # Space Complexity ==> O(chunk_size)
+
+        # Streams the full (never truncated) repr, chunk_size values per write
+        chunk = []
+        separator = ''
+        written = 0
+
+        for node in self:
+            chunk.append(str(node.data))
+
+            if len(chunk) == chunk_size:
+                fileobj.write(separator + ', '.join(chunk))
+                separator = ', '
+                written += len(chunk)
+                chunk.clear()
+
+        if chunk:
+            fileobj.write(separator + ', '.join(chunk))
+            written += len(chunk)
+
+        self._count_hops(written)
+        return written
+
+    def __reduce__(self):
+        # Instrumented lists live in a generated subclass, pickle them as the plain class
+        return getattr(type(self), '_plain_class', type(self)), (), self.__getstate__()
+
+    def __getstate__(self):
+        # Flat state: the weak registry cannot be pickled, and pickling the
+        # nodes would recurse once per node through .next
+        state = {
+            'values': [node.data for node in self],
+            'track_nodes': self.debug_data is not None,
+            'track_hash': self.content_hash is not None,
+            'instrument': self._stats is not None,
+            'verify': self.verify,
+            'verify_every': self.verify_every,
+        }
+        if 'repr_limit' in self.__dict__:
+            state['repr_limit'] = self.repr_limit
+        return state
+
+    def __setstate__(self, state):
+        self.__init__(state['values'], track_nodes=state['track_nodes'], track_hash=state['track_hash'],
+                      instrument=state['instrument'], verify=state['verify'],
+                      verify_every=state['verify_every'])
+        if 'repr_limit' in state:
+            self.repr_limit = state['repr_limit']
     ##############################################
     
+    @instrumented
     def insert_front(self, value):
         
         # Time Complexity ==> O(1)
         # Space Complexity ==> O(1)
         
+        # Hash first: an unhashable value must raise before the list changes
+        if self.content_hash is not None:
+            self._hash_push_front(value)
         newNode = Node(value)
         
         if self.length == 0:
@@ -156,13 +517,16 @@ class LinkedList:
             self.head.next = prevHead
                 
         self._add_node(newNode)
-        self.debug_verify_data_integrity()
+        self._verify_mutation()
     
+    @instrumented
     def delete_front(self):
         
         # Time Complexity ==> O(1)
         # Space Complexity ==> O(1)
         
+        removed = self.head
+        
         if self.length == 0:
             print("Your List is Already Empty")
             return
@@ -175,8 +539,11 @@ class LinkedList:
             self._delete_node(self.head)
             self.head = self.head.next
         
-        self.debug_verify_data_integrity()
+        if self.content_hash is not None:
+            self._hash_pop_front(removed.data)
+        self._verify_mutation()
 
+    @instrumented
     def get_nth_back(self, n):
         
         # Time Complexity ==> O(n)
@@ -193,64 +560,207 @@ class LinkedList:
             temp = temp.next
             i += 1
             
-        
+        self._count_hops(steps)
         return temp
         
+    @instrumented
     def is_identical_to(self, lst):
-        # Time Complexity ==> O(n)
+        # Time Complexity ==> O(1) when lengths or content hashes differ, else O(n)
         # Space Complexity ==> O(1)
         
-        len1,len2 = 0, 0
+        if self.length != lst.length:
+            return False
         
-        temp1,temp2 = self.head, lst.head
+        if self.content_hash is not None and lst.content_hash is not None \
+                and self.content_hash != lst.content_hash:
+            return False
         
-        while temp1 is not None:
-            len1 += 1
-            temp1 = temp1.next
+        # Same length (and hash): still compare values, hashes can collide
+        temp1,temp2 = self.head, lst.head
+        compared = 0
         
         while temp2 is not None:
-            len2 += 1
-            temp2 = temp2.next
-            
-        temp1,temp2 = self.head, lst.head   
-        
-        if len1 == len2:
-            while temp2 is not None:
-                if temp1.data == temp2.data:
-                    temp1 = temp1.next
-                    temp2 = temp2.next
-                    
-                else :
-                    return False
+            if temp1.data == temp2.data:
+                temp1 = temp1.next
+                temp2 = temp2.next
+                compared += 1
                 
-            return True
-        else:
-            return False
+            else :
+                self._count_hops(2 * compared)
+                return False
+            
+        self._count_hops(2 * compared)
+        return True
         
+    @instrumented
     def add_element(self, value):
-        # Time Complexity ==> O(n)
+        # Time Complexity ==> O(1), the tail is already stored
         # Space Complexity ==> O(1)
         
-        # Empty List
-        if not self.head:
-            self.head = Node(value)
+        self.insert_end(value)
+            
+    @instrumented
+    def get_tail(self):
+        if not self.head : return "None"
+        
+        return self.tail
+    
+    ##############################################
+    
+    @instrumented
+    def concat(self, lst):
+        # Time Complexity ==> O(1) relinking through tail, O(k) for k = lst.length when
+        #                      the registry is tracked (or lst carries no content hash)
+        # Space Complexity ==> O(1)
+        
+        # Moves every node of lst to the end of this list, lst becomes empty.
+        # lst's registry entries are appended after ours, so the registry keeps
+        # insertion order. That merge is a Python-level loop (WeakValueDictionary
+        # .update builds one KeyedRef per entry, ~4us each); track_nodes=False skips it.
+        if lst is self or lst.length == 0:
             return
         
+        if self.content_hash is not None:
+            other_hash = lst.content_hash
+            if other_hash is None:
+                other_hash = 0
+                for node in lst:
+                    other_hash = (other_hash * HASH_BASE + hash(node.data)) % HASH_MOD
+            
+            other_power = pow(HASH_BASE, lst.length, HASH_MOD)
+            self.content_hash = (self.content_hash * other_power + other_hash) % HASH_MOD
+            self._hash_power = self._hash_power * other_power % HASH_MOD
+        
+        if self.debug_data is not None:
+            if lst.debug_data is not None:
+                self.debug_data.update(lst.debug_data)
+            else:
+                self.debug_data.update((id(node), node) for node in lst)
+        
+        if self.tail is None:
+            self.head = lst.head
+        else:
+            self.tail.next = lst.head
+        
+        self.tail = lst.tail
+        self.length += lst.length
+        lst._reset()
+        
+        self._verify_mutation()
+    
+    def _reset(self):
+        self.head = self.tail = None
+        self.length = 0
+        
+        if self.debug_data is not None:
+            self.debug_data = weakref.WeakValueDictionary()
+        if self.content_hash is not None:
+            self.content_hash = 0
+            self._hash_power = 1
+    
+    @instrumented
+    def split_at(self, i):
+        # Time Complexity ==> O(i) to find the cut, plus O(n - i) to move registry entries
+        # Space Complexity ==> O(1)
+        
+        # Keeps the first i values, returns a new list with the rest
+        if i < 0 or i > self.length:
+            return None
+        
+        hashing = self.content_hash is not None
+        rest = type(self)(track_nodes=self.debug_data is not None, track_hash=hashing,
+                          instrument=self._stats is not None, verify=self.verify,
+                          verify_every=self.verify_every)
+        
+        if i == self.length:
+            return rest
+        
+        prev = None
         temp = self.head
+        prefix_hash = 0
         
-        # Traverse to next if has data
-        while temp.next: temp = temp.next
+        for _ in range(i):
+            if hashing:
+                prefix_hash = (prefix_hash * HASH_BASE + hash(temp.data)) % HASH_MOD
+            prev = temp
+            temp = temp.next
         
-        temp.next = Node(value)
-            
-    def get_tail(self):
-        if not self.head : return "None"
+        self._count_hops(i)
+        rest.head = temp
+        rest.tail = self.tail
+        rest.length = self.length - i
+        
+        if prev is None:
+            self.head = self.tail = None
+        else:
+            prev.next = None
+            self.tail = prev
+        self.length = i
+        
+        if self.debug_data is not None:
+            for node in rest:
+                del self.debug_data[id(node)]
+                rest.debug_data[id(node)] = node
         
+        if hashing:
+            rest._hash_power = pow(HASH_BASE, rest.length, HASH_MOD)
+            rest.content_hash = (self.content_hash - prefix_hash * rest._hash_power) % HASH_MOD
+            self.content_hash = prefix_hash
+            self._hash_power = pow(HASH_BASE, i, HASH_MOD)
+        
+        self._verify_mutation()
+        rest._verify_mutation()
+        return rest
+    
+    @instrumented
+    def delete_range(self, i, j):
+        # Time Complexity ==> O(j), a single relink
+        # Space Complexity ==> O(1)
+        
+        # Deletes positions i .. j-1
+        if i < 0 or j > self.length or i > j:
+            return "Invalid Range"
+        
+        if i == j:
+            return
+        
+        hashing = self.content_hash is not None
+        prefix_hash = 0
+        prev = None
         temp = self.head
         
-        while temp.next : temp = temp.next
+        for _ in range(i):
+            if hashing:
+                prefix_hash = (prefix_hash * HASH_BASE + hash(temp.data)) % HASH_MOD
+            prev = temp
+            temp = temp.next
+        
+        removed_hash = prefix_hash
+        for _ in range(j - i):
+            if hashing:
+                removed_hash = (removed_hash * HASH_BASE + hash(temp.data)) % HASH_MOD
+            if self.debug_data is not None:
+                del self.debug_data[id(temp)]
+            temp = temp.next
         
-        return temp
+        self._count_hops(j)
+        if prev is None:
+            self.head = temp
+        else:
+            prev.next = temp
+        
+        if temp is None:
+            self.tail = prev
+        
+        if hashing:
+            # hash = prefix * BASE^(n-j) + suffix, where suffix = hash - hash(first j) * BASE^(n-j)
+            suffix_power = pow(HASH_BASE, self.length - j, HASH_MOD)
+            suffix_hash = self.content_hash - removed_hash * suffix_power
+            self.content_hash = (prefix_hash * suffix_power + suffix_hash) % HASH_MOD
+            self._hash_power = pow(HASH_BASE, self.length - (j - i), HASH_MOD)
+        
+        self.length -= j - i
+        self._verify_mutation()
         
         
 def test1():
@@ -602,7 +1112,409 @@ def test25():
 
     assert result == expected , f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
     print('PASSED\n')
-    
+
+def test26():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30, 40])
+
+    lst.delete_front()
+    lst.insert_front(5)
+    lst.debug_print_existing_nodes()
+    result = ', '.join(str(node) for node in lst.debug_data.values())
+    expected = "20, 30, 40, 5"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test27():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([10, 20, 30], track_nodes=False)
+
+    lst.insert_front(5)
+    lst.delete_front()
+    lst.debug_print_existing_nodes()
+    result = f'{lst} | {lst.length} | {lst.debug_data}'
+    expected = "10, 20, 30 | 3 | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test28():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList.from_iterable(range(5000))
+
+    lst.extend([5000, 5001])
+    lst.debug_verify_data_integrity()
+    result = f'{lst.head} | {lst.tail} | {lst.length}'
+    expected = "0 | 5001 | 5002"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test29():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([6, 10, 8, 15])
+
+    nodes = list(lst)
+    nodes[3].next = nodes[0]
+    result = str(lst.debug_find_cycle())
+    expected = "(0, 4)"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test30():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(100000))
+
+    result = str(lst.debug_find_cycle())
+    expected = "None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test31():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([])
+
+    footprint = lst.memory_footprint()
+    result = f"{footprint['nodes']} | {footprint['node_bytes']} | {footprint['payload_bytes']} | {footprint['registry_bytes_per_node']}"
+    expected = "0 | 0 | 0 | 0"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test32():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([6, 10, 8, 15])
+
+    lst.repr_limit = 3
+    result = str(lst)
+    expected = '6, 10, 8, 15'
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test33():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([])
+
+    output = io.StringIO()
+    written = lst.write_to(output)
+    result = f'[{output.getvalue()}] | {written}'
+    expected = '[] | 0'
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test34():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    lst1 = LinkedList([2, 3], track_hash=True)
+    lst1.insert_front(1)
+    lst1.insert_end(4)
+    lst1.delete_front()
+    lst2 = LinkedList([2, 3, 4], track_hash=True)
+    lst3 = LinkedList([2, 4, 3], track_hash=True)
+
+    result = f'{lst1.content_hash == lst2.content_hash} | {lst1.is_identical_to(lst2)} | {lst1.is_identical_to(lst3)}'
+    expected = "True | True | False"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test35():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    lst1 = LinkedList([1, 2, 3], track_hash=True)
+    lst2 = LinkedList([1, 2, 3])
+    lst1.delete_front()
+    lst1.delete_front()
+    lst1.delete_front()
+
+    result = f'{lst1.content_hash} | {lst1.is_identical_to(LinkedList([]))} | {lst2.is_identical_to(LinkedList([1, 2, 3], track_hash=True))}'
+    expected = "0 | True | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test36():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    lst1 = LinkedList([1, 2, 3], track_hash=True)
+    lst2 = LinkedList([4, 5], track_hash=True)
+    lst1.concat(lst2)
+    lst1.concat(LinkedList([6]))
+    lst1.debug_print_existing_nodes()
+
+    result = f'{lst1} | {lst1.tail} | [{lst2}] | {lst2.length} | {lst1.is_identical_to(LinkedList(range(1, 7), track_hash=True))}'
+    expected = "1, 2, 3, 4, 5, 6 | 6 | [] | 0 | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test37():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    lst = LinkedList([1, 2, 3, 4, 5], track_hash=True)
+    rest = lst.split_at(2)
+    lst.debug_print_existing_nodes()
+    rest.debug_print_existing_nodes()
+
+    same_hashes = lst.content_hash == LinkedList([1, 2], track_hash=True).content_hash \
+        and rest.content_hash == LinkedList([3, 4, 5], track_hash=True).content_hash
+    result = f'{lst} | {rest} | {lst.tail} | {same_hashes} | {lst.split_at(6)}'
+    expected = "1, 2 | 3, 4, 5 | 2 | True | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test38():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    lst = LinkedList([1, 2, 3, 4, 5, 6], track_hash=True)
+    lst.delete_range(1, 3)
+    lst.delete_range(2, 4)
+    lst.debug_print_existing_nodes()
+
+    same_hash = lst.content_hash == LinkedList([1, 4], track_hash=True).content_hash
+    result = f'{lst} | {lst.tail} | {lst.length} | {same_hash} | {lst.delete_range(1, 5)}'
+    expected = "1, 4 | 4 | 2 | True | Invalid Range"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test39():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    lst = LinkedList([1, 2, 3])
+    lst.delete_range(0, 3)
+    lst.debug_print_existing_nodes()
+    rest = LinkedList([7, 8]).split_at(0)
+
+    result = f'[{lst}] | {lst.head} | {lst.tail} | {rest} | {rest.tail}'
+    expected = "[] | None | None | 7, 8 | 8"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test40():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([6, 10, 8, 15, 20], instrument=True, verify='full')
+
+    lst.reset_stats()
+    lst.get_nth_back(2)
+    lst.get_nth_back(5)
+    lst.insert_end(25)
+    stats = lst.stats()
+    result = f"{stats['get_nth_back']['calls']} | {stats['get_nth_back']['hops']} | {stats['insert_end']['hops']}"
+    result += f" | {stats['debug_verify_data_integrity']['calls']}"
+    expected = "2 | 3 | 15 | 1"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test41():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst1 = LinkedList([1, 2, 3], instrument=True)
+
+    lst1.is_identical_to(LinkedList([1, 2, 4]))
+    lst1.reset_stats()
+    lst1.is_identical_to(LinkedList([1, 2, 3]))
+    result = f"{lst1.stats()['is_identical_to']['hops']} | {len(lst1.stats())}"
+    expected = "6 | 1"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test42():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3, 4, 5, 6], verify='cheap', verify_every=3)
+
+    rest = lst.split_at(2)
+    lst.concat(rest)            # 3rd mutation runs the full walk
+    lst.delete_range(1, 3)
+    lst.insert_front(0)
+    report = lst.verify_report()
+    silent = LinkedList(range(5), verify='off')
+    silent.delete_front()
+    result = f"{lst} | {report['mutations']} | {report['cheap_checks']} | {report['full_checks']}"
+    result += f" | {silent.verify_report()['mutations']}"
+    expected = "0, 1, 4, 5, 6 | 5 | 4 | 1 | 0"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test43():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3, 4, 5])
+
+    # nodes moved out by split_at / delete_range are not kept by the registry
+    rest = lst.split_at(3)
+    moved = weakref.ref(rest.head)
+    del rest
+    lst.delete_range(0, 2)
+    report = lst.leak_report()
+    untracked = LinkedList([1], track_nodes=False).leak_report()
+    result = f'{moved() is None} | {lst} | {report} | {len(lst.debug_data)} | {untracked}'
+    expected = "True | 3 | [] | 1 | Node tracking is disabled"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test44():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList(range(5))
+
+    lst.repr_limit = 0
+    result = f'{lst} | {LinkedList([7])}'
+    lst.repr_limit = -1
+    try:
+        result += f' | {lst}'
+    except AssertionError as error:
+        result += f' | {error}'
+    expected = "... 4 more ..., 4 | 7 | repr_limit must be None or >= 0, got -1"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test45():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+
+    class TaggedList(LinkedList):
+        pass
+
+    lst = TaggedList([1, 2, 3, 4], instrument=True, track_nodes=False)
+    rest = lst.split_at(2)
+    rest.delete_front()
+    recorded = sorted(rest.stats())
+    result = f'{type(rest).__name__} | {rest} | {rest.debug_data} | {recorded}'
+    expected = "TaggedList | 4 | None | ['delete_front']"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test46():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    plain = LinkedList([1, 2])
+    recorded = LinkedList([1, 2], instrument=True)
+
+    repr(recorded)
+    result = f"{hasattr(type(plain).__repr__, '__wrapped__')} | {recorded.stats()['__repr__']['calls']}"
+    result += f' | {type(recorded).__name__} | {isinstance(recorded, LinkedList)}'
+    expected = "False | 1 | LinkedList | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test47():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3], track_hash=True, instrument=True, verify='full', verify_every=7)
+    lst.repr_limit = 1
+
+    copy = pickle.loads(pickle.dumps(lst))
+    copy.reset_stats()
+    copy.insert_end(4)
+    recorded = sorted(copy.stats())
+    copy.debug_verify_data_integrity()
+    result = f'{copy} | {type(copy).__name__} | {recorded} | {copy.verify} {copy.verify_every}'
+    result += f' | {copy.content_hash == LinkedList([1, 2, 3, 4], track_hash=True).content_hash}'
+    result += f' | {len(copy.debug_data)} | {pickle.loads(pickle.dumps(LinkedList(track_nodes=False))).debug_data}'
+    expected = "1, ... 2 more ..., 4 | LinkedList | ['debug_verify_data_integrity', 'insert_end'] | full 7 | True | 4 | None"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test48():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    small = LinkedList([1, 2])
+    big = LinkedList(range(3, 8))
+
+    small.concat(big)   # a bigger lst still lands after our own entries
+    small.delete_front()
+    small.debug_verify_data_integrity()
+    counts = f'{len(small.debug_data)} {len(big.debug_data)}'
+
+    big.insert_end(9)
+    small.concat(big)
+    big.insert_end(10)
+    big.debug_verify_data_integrity()
+    small.debug_verify_data_integrity()
+    registered = ', '.join(str(node) for node in small.debug_data.values())
+    result = f'{small} | {registered} | {counts} | {len(small.debug_data)} | {len(big.debug_data)}'
+    expected = "2, 3, 4, 5, 6, 7, 9 | 2, 3, 4, 5, 6, 7, 9 | 6 0 | 7 | 1"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test49():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2, 3])
+
+    def broken():
+        yield 4
+        yield 5
+        raise ValueError('source failed')
+
+    try:
+        lst.extend(broken())
+        outcome = 'extended'
+    except ValueError as error:
+        outcome = str(error)
+    # values linked before the failure stay, the list is still consistent
+    lst.insert_end(6)
+    lst.debug_verify_data_integrity()
+    result = f'{outcome} | {lst} | {lst.length} | {lst.tail}'
+    expected = "source failed | 1, 2, 3, 4, 5, 6 | 6 | 6"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test50():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = LinkedList([1, 2], track_hash=True)
+    before = lst.content_hash
+
+    outcomes = []
+    for insert in (lst.insert_end, lst.insert_front, lambda value: lst.extend([3, value])):
+        try:
+            insert([1])
+            outcomes.append('inserted')
+        except TypeError:
+            outcomes.append('TypeError')
+    lst.debug_verify_data_integrity()
+    same = lst.content_hash == LinkedList([1, 2, 3], track_hash=True).content_hash
+    result = f"{', '.join(outcomes)} | {lst} | {lst.length} | {len(lst.debug_data)} | {same} | {before != lst.content_hash}"
+    expected = "TypeError, TypeError, TypeError | 1, 2, 3 | 3 | 3 | True | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
 
 if __name__ == '__main__':
     # test1()  # empty
@@ -639,6 +1551,65 @@ if __name__ == '__main__':
     test24() # one element
     test25() # two element in list
     
+    # ========= Node registry =========
+    test26() # insertion order kept after delete
+    test27() # bookkeeping disabled
+    
+    # ========= Bulk construction =========
+    test28() # beyond the old 1000 node limit
+    
+    # ========= Cycle detection =========
+    test29() # cycle back to head
+    test30() # long list without cycle
+    
+    # ========= Memory footprint =========
+    test31() # empty list
+    
+    # ========= Repr / streaming export =========
+    test32() # limit not reached, nothing truncated
+    test33() # empty list
+    
+    # ========= Content hash =========
+    test34() # same values through different insert/delete paths
+    test35() # emptied list, mixed hashing / non hashing lists
+    
+    # ========= Bulk splice =========
+    test36() # concat
+    test37() # split at
+    test38() # delete range
+    test39() # whole list ranges
+    
+    # ========= Instrumentation =========
+    test40() # hops per operation, nested verification
+    test41() # reset
+    
+    # ========= Tiered verification =========
+    test42() # sampled full walks, off mode
+    
+    # ========= Weak node tracking =========
+    test43() # nothing kept alive by the registry
+    
+    # ========= Repr limit =========
+    test44() # repr_limit=0 shows only the tail
+    
+    # ========= Split settings =========
+    test45() # split_at keeps the subclass and instrumentation
+    
+    # ========= Instrumentation off the hot path =========
+    test46() # wrappers only on instrumented lists
+    
+    # ========= Pickling =========
+    test47() # flat state, settings kept
+    
+    # ========= Registry merge =========
+    test48() # registry keeps insertion order
+    
+    # ========= Failing source =========
+    test49() # extend keeps the tail on the last linked node
+    
+    # ========= Unhashable values =========
+    test50() # rejected before the list changes
+    
     # Must see to insure no RTE
     print('ALL CASES PASSED')
 
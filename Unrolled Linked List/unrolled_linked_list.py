@@ -0,0 +1,329 @@
+import inspect
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from linked_list_loader import load_linked_list  # noqa: E402
+
+
+class Block:
+    __slots__ = ('values', 'next')  # no per-instance __dict__
+
+    def __init__(self, values=None, next=None):
+        self.values = values if values is not None else []
+        self.next = next
+
+    def __repr__(self):
+        return f'{self.values}'
+
+
+class UnrolledLinkedList:
+    # Each node holds up to block_size values, so there are n / block_size
+    # nodes to allocate and hop through instead of n.
+
+    def __init__(self, initial_values=None, block_size=64):
+        assert block_size >= 2
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.blocks = 0
+
+        if initial_values:
+            self.extend(initial_values)
+
+    def __iter__(self):
+        block = self.head
+        while block is not None:
+            yield from block.values
+            block = block.next
+
+    def __repr__(self):
+        return ', '.join(map(str, self))
+
+    def _locate(self, index):
+        # Time Complexity ==> O(n / block_size)
+
+        # (block before, block, offset inside block) holding position index
+        prev = None
+        block = self.head
+
+        while index >= len(block.values):
+            index -= len(block.values)
+            prev = block
+            block = block.next
+
+        return prev, block, index
+
+    def _unlink(self, prev, block):
+        if prev is None:
+            self.head = block.next
+        else:
+            prev.next = block.next
+
+        if block is self.tail:
+            self.tail = prev
+
+        self.blocks -= 1
+
+    def extend(self, values):
+        # Time Complexity ==> O(k)
+        for value in values:
+            self.insert_end(value)
+
+    def insert_end(self, value):
+        # Time Complexity ==> O(1)
+        # Space Complexity ==> O(1)
+
+        if self.tail is None or len(self.tail.values) == self.block_size:
+            block = Block()
+            if self.tail is None:
+                self.head = self.tail = block
+            else:
+                self.tail.next = block
+                self.tail = block
+            self.blocks += 1
+
+        self.tail.values.append(value)
+        self.length += 1
+
+    def insert_front(self, value):
+        # Time Complexity ==> O(block_size)
+        # Space Complexity ==> O(1)
+
+        if self.head is None or len(self.head.values) == self.block_size:
+            self.head = Block(next=self.head)
+            if self.tail is None:
+                self.tail = self.head
+            self.blocks += 1
+
+        self.head.values.insert(0, value)
+        self.length += 1
+
+    def delete_front(self):
+        # Time Complexity ==> O(block_size)
+        # Space Complexity ==> O(1)
+
+        if self.head is None:
+            return "Linked List is Empty"
+
+        self.head.values.pop(0)
+        if not self.head.values:
+            self._unlink(None, self.head)
+        self.length -= 1
+
+    def delete_last(self):
+        # Time Complexity ==> O(1), O(n / block_size) when the tail block empties
+        # Space Complexity ==> O(1)
+
+        if self.tail is None:
+            return "Linked List is Empty"
+
+        self.tail.values.pop()
+        if not self.tail.values:
+            prev = None
+            block = self.head
+            while block is not self.tail:
+                prev = block
+                block = block.next
+            self._unlink(prev, block)
+        self.length -= 1
+
+    def delete_node_nth(self, node):
+        # Time Complexity ==> O(n / block_size + block_size)
+        # Space Complexity ==> O(1)
+
+        if node < 0 or node >= self.length:
+            return "Invalid Node"
+
+        elif node == 0:
+            self.delete_front()
+            return "First Item Deleted"
+
+        elif node == self.length - 1:
+            self.delete_last()
+            return "Last Item Deleted"
+
+        prev, block, offset = self._locate(node)
+        value = block.values.pop(offset)
+        self.length -= 1
+
+        if not block.values:
+            self._unlink(prev, block)
+        elif block.next is not None and len(block.values) + len(block.next.values) <= self.block_size // 2:
+            # keep blocks dense: merge two under-filled neighbours
+            block.values.extend(block.next.values)
+            self._unlink(block, block.next)
+
+        return f"Node {node} with value {value} Deleted"
+
+    def get_nth_back(self, n):
+        # Time Complexity ==> O(n / block_size)
+        # Space Complexity ==> O(1)
+
+        if n > self.length or n <= 0:
+            return None
+
+        _, block, offset = self._locate(self.length - n)
+        return block.values[offset]
+
+    def is_identical_to(self, lst):
+        if self.length != lst.length:
+            return False
+
+        return all(a == b for a, b in zip(self, lst))
+
+    def memory_footprint(self):
+        # Time Complexity ==> O(n / block_size)
+
+        block_bytes = 0
+        block = self.head
+        while block is not None:
+            block_bytes += sys.getsizeof(block) + sys.getsizeof(block.values)
+            block = block.next
+
+        return {
+            'nodes': self.blocks,
+            'values': self.length,
+            'node_bytes': block_bytes,
+            'bytes_per_value': block_bytes / self.length if self.length else 0,
+        }
+
+    def debug_verify_data_integrity(self):
+        if self.length == 0:
+            assert self.head is None
+            assert self.tail is None
+            assert self.blocks == 0
+            return
+
+        assert self.head is not None
+        assert self.tail is not None
+        assert self.tail.next is None
+
+        actual_lst_len = 0
+        actual_blocks = 0
+        block = self.head
+        while block is not None:
+            assert 0 < len(block.values) <= self.block_size
+            actual_lst_len += len(block.values)
+            actual_blocks += 1
+            assert actual_blocks <= self.blocks  # Consider infinite cycle
+            last = block
+            block = block.next
+
+        assert last is self.tail
+        assert self.length == actual_lst_len
+        assert self.blocks == actual_blocks
+
+
+def benchmark_block_sizes(size=10**6, block_sizes=(8, 32, 64, 256), probes=200):
+    # Trade-off against one value per Node: memory, full scans, positional reads
+    LinkedList = load_linked_list('homework')
+
+    def measure(name, lst, footprint):
+        start = time.perf_counter()
+        total = 0
+        for value in lst:
+            total += value.data if name == 'Node' else value
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(1, probes + 1):
+            lst.get_nth_back(i * (size // probes))
+        probe = (time.perf_counter() - start) / probes
+
+        print(f'{name:<10} {footprint:8.1f} bytes/value   scan {scan:.3f}s   get_nth_back {probe * 1e6:10.1f}us')
+
+    lst = LinkedList(range(size), track_nodes=False)
+    footprint = lst.memory_footprint()
+    measure('Node', lst, footprint['node_bytes'] / size)
+    del lst
+
+    for block_size in block_sizes:
+        lst = UnrolledLinkedList(range(size), block_size=block_size)
+        measure(f'K={block_size}', lst, lst.memory_footprint()['bytes_per_value'])
+
+
+def test1():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = UnrolledLinkedList(range(10), block_size=4)
+
+    lst.insert_front(-1)
+    lst.insert_end(10)
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {lst.length} | {lst.blocks}'
+    expected = "-1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 | 12 | 4"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test2():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = UnrolledLinkedList([], block_size=4)
+
+    result = f'{lst.delete_front()} | {lst.delete_last()} | {lst.get_nth_back(1)} | {lst.delete_node_nth(0)}'
+    expected = "Linked List is Empty | Linked List is Empty | None | Invalid Node"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test3():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = UnrolledLinkedList(range(9), block_size=4)
+
+    lst.delete_last()      # tail block [8] disappears
+    lst.delete_front()
+    message = lst.delete_node_nth(3)
+    lst.debug_verify_data_integrity()
+    result = f'{lst} | {message} | {lst.blocks}'
+    expected = "1, 2, 3, 5, 6, 7 | Node 3 with value 4 Deleted | 2"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test4():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst = UnrolledLinkedList([6, 10, 8, 15, 3], block_size=2)
+    shadow = [6, 10, 8, 15, 3]
+
+    backs = [lst.get_nth_back(n) for n in range(1, 6)]
+    while lst.length > 1:
+        lst.delete_node_nth(1)
+        del shadow[1]
+        lst.debug_verify_data_integrity()
+
+    result = f'{backs} | {lst} | {list(lst) == shadow}'
+    expected = "[3, 15, 8, 10, 6] | 6 | True"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+def test5():
+    func_name = inspect.currentframe().f_code.co_name
+    print(f'Testing {func_name}')
+    lst1 = UnrolledLinkedList([1, 2, 3], block_size=2)
+    lst2 = UnrolledLinkedList([1, 2, 3], block_size=8)
+
+    result = f'{lst1.is_identical_to(lst2)} | {lst1.is_identical_to(UnrolledLinkedList([1, 2]))}'
+    expected = "True | False"
+
+    assert result == expected, f'Mismatch between expected=[{expected}] and result=[{result}] in {func_name}'
+    print('PASSED\n')
+
+
+if __name__ == '__main__':
+    test1()  # insert front / end across blocks
+    test2()  # empty list
+    test3()  # deletes emptying and merging blocks
+    test4()  # nth back, deleting down to one value
+    test5()  # identical lists with different block sizes
+
+    # benchmark_block_sizes()
+
+    # Must see to insure no RTE
+    print('ALL CASES PASSED')
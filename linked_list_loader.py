@@ -0,0 +1,30 @@
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HOMEWORK_FOLDER = 'Singly Linked List Homework 1 - 6 Easy Challenges'
+
+# The singly linked lists the other folders build on, by module name
+PATHS = {
+    'delete': os.path.join(ROOT, 'Delete', 'delete.py'),
+    'homework': os.path.join(ROOT, HOMEWORK_FOLDER, f'{HOMEWORK_FOLDER}.py'),
+}
+
+
+def load_linked_list(name='delete'):
+    # The folders are not packages (spaces in their names), so the module is
+    # loaded from its path once and registered under `name`, which also lets
+    # pickle find the class again
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, PATHS[name])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+
+    return module.LinkedList